@@ -5,18 +5,41 @@ Military-grade file destruction with guaranteed metadata obfuscation
 
 import os
 import shutil
-import secrets
+import stat
 import logging
+import mmap
 import platform
 import threading
 import time
-import random
 import re
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from typing import Callable, Optional, Tuple, List, Dict
+from types import MappingProxyType
+from typing import Callable, Optional, Tuple, List, Dict, Iterator, Mapping, Sequence
 import ctypes
 import ctypes.wintypes
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# macOS has no posix_fadvise - F_NOCACHE disables caching per descriptor instead
+_F_NOCACHE = getattr(fcntl, "F_NOCACHE", None)
+
+try:
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms
+except ImportError:  # Random passes fall back to the OS CSPRNG
+    Cipher = algorithms = None
+
+__all__ = [
+    "ShredError", "OperationInterrupted", "AdvancedModeShredder", "AsyncWriteEngine",
+    "WindowsTimestampObfuscator", "safety_check_shred_path", "shred_file_Advanced_mode",
+    "shred_file", "shred_directory", "estimate_shred_time", "verify_shred_completion",
+    "get_available_methods", "validate_shredding_path",
+]
+
 # Enhanced logging
 logging.basicConfig(level=logging.INFO)
 LOG = logging.getLogger("Advanced_mode_shredder")
@@ -25,7 +48,97 @@ class ShredError(RuntimeError):
     pass
 
 class OperationInterrupted(Exception):
-    pass
+    """Kept for callers that catch it - the shredder itself signals cancellation by returning _INTERRUPTED"""
+
+# Returned (by identity) when the user cancels - cancellation is an expected outcome, not an error
+_INTERRUPTED = (False, "Operation cancelled by user")
+_DISCOVERY_INTERRUPTED = (False, "Operation cancelled during file discovery")
+
+# Directory result templates - filled with the file count on return
+_MSG_PRESERVED = "DIRECTORY OVERWRITTEN: %d FILES (PRESERVED)"
+_MSG_DESTROYED = "DIRECTORY DESTROYED: %d FILES - IRRECOVERABLE"
+
+# validate_shredding_path results - immutable, shared by every call
+_INVALID_NOT_EXIST = (False, "Path does not exist")
+_INVALID_SYMLINK = (False, "Symbolic links not supported")
+_INVALID_SYSTEM = (False, "Path is in system location")
+_VALID_OK = (True, "Path validated - Advanced MODE READY")
+
+class _ConstPattern:
+    """Deterministic pass pattern - builds its buffer once and hands out zero-copy slices"""
+
+    __slots__ = ("unit", "buf")
+
+    CACHE_LIMIT = 2 * 1024 * 1024  # Largest buffer kept per pattern (covers files up to 1GB)
+    _instances: Dict[bytes, "_ConstPattern"] = {}
+
+    def __new__(cls, unit: bytes):
+        # Passes repeating a pattern (5/15, 6/20, 7-9/26-28) share one cached buffer
+        inst = cls._instances.get(unit)
+        if inst is None:
+            inst = super().__new__(cls)
+            inst.unit = unit
+            inst.buf = b""
+            cls._instances[unit] = inst
+        return inst
+
+    @property
+    def kind(self) -> str:
+        return "const" if len(self.unit) == 1 else "triplet"
+
+    def _build(self, size: int):
+        # One repetition plus a zero-copy view - no second size-length slice copy
+        return memoryview(self.unit * (size // len(self.unit) + 1))[:size]
+
+    def __call__(self, size: int):
+        buf = self.buf
+        if size > len(buf):
+            if size > self.CACHE_LIMIT:
+                return self._build(size)
+            # Local binding keeps concurrent callers from slicing a smaller rebuild
+            buf = self.buf = self._build(size)
+        return buf[:size]
+
+# Plaintext fed to the ChaCha20 random passes
+_ZERO_PATTERN = _ConstPattern(b"\x00")
+
+class _RandomPattern:
+    """Random pass - ChaCha20 keystream seeded from OS entropy, os.urandom without cryptography"""
+
+    RESEED_BYTES = 256 * 1024 * 1024  # Fresh key/nonce after this much keystream
+    kind = "random"
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _encryptor(self, size: int):
+        state = self._local
+        if getattr(state, "remaining", 0) < size:
+            # Thread-local stream: pool workers never share cipher state
+            key, nonce = os.urandom(32), os.urandom(16)
+            state.enc = Cipher(algorithms.ChaCha20(key, nonce), mode=None).encryptor()
+            state.remaining = self.RESEED_BYTES
+        state.remaining -= size
+        return state.enc
+
+    def __call__(self, size: int) -> bytes:
+        if Cipher is None:
+            return os.urandom(size)
+        return self._encryptor(size).update(_ZERO_PATTERN(size))
+
+    def fill(self, out: memoryview):
+        """Generate len(out) random bytes directly into out"""
+        size = len(out)
+        if Cipher is None:
+            out[:] = os.urandom(size)
+            return
+        enc = self._encryptor(size)
+        # Encrypt in cached-zero-buffer steps so large chunks never build a size-length plaintext
+        step = _ConstPattern.CACHE_LIMIT
+        zeros = _ZERO_PATTERN(min(size, step))
+        for start in range(0, size, step):
+            piece = out[start:start + step]
+            enc.update_into(zeros[:len(piece)], piece)
 
 class AdvancedModeShredder:
     """ULTIMATE shredding engine with maximum security patterns"""
@@ -33,41 +146,44 @@ class AdvancedModeShredder:
     # GUTMANN 35-PASS METHOD - MAXIMUM SECURITY
     PATTERNS = {
         "gutmann_35_pass": [
-            *[lambda size: secrets.token_bytes(size) for _ in range(4)],   # Random passes 1-4
-            lambda size: bytes([0x55] * size),                            # Pass 5
-            lambda size: bytes([0xAA] * size),                            # Pass 6
-            lambda size: bytes([0x92, 0x49, 0x24] * (size // 3 + 1))[:size], # Pass 7
-            lambda size: bytes([0x49, 0x24, 0x92] * (size // 3 + 1))[:size], # Pass 8
-            lambda size: bytes([0x24, 0x92, 0x49] * (size // 3 + 1))[:size], # Pass 9
-            lambda size: bytes([0x00] * size),                            # Pass 10
-            lambda size: bytes([0x11] * size),                            # Pass 11
-            lambda size: bytes([0x22] * size),                            # Pass 12
-            lambda size: bytes([0x33] * size),                            # Pass 13
-            lambda size: bytes([0x44] * size),                            # Pass 14
-            lambda size: bytes([0x55] * size),                            # Pass 15
-            lambda size: bytes([0x66] * size),                            # Pass 16
-            lambda size: bytes([0x77] * size),                            # Pass 17
-            lambda size: bytes([0x88] * size),                            # Pass 18
-            lambda size: bytes([0x99] * size),                            # Pass 19
-            lambda size: bytes([0xAA] * size),                            # Pass 20
-            lambda size: bytes([0xBB] * size),                            # Pass 21
-            lambda size: bytes([0xCC] * size),                            # Pass 22
-            lambda size: bytes([0xDD] * size),                            # Pass 23
-            lambda size: bytes([0xEE] * size),                            # Pass 24
-            lambda size: bytes([0xFF] * size),                            # Pass 25
-            lambda size: bytes([0x92, 0x49, 0x24] * (size // 3 + 1))[:size], # Pass 26
-            lambda size: bytes([0x49, 0x24, 0x92] * (size // 3 + 1))[:size], # Pass 27
-            lambda size: bytes([0x24, 0x92, 0x49] * (size // 3 + 1))[:size], # Pass 28
-            lambda size: bytes([0x6D, 0xB6, 0xDB] * (size // 3 + 1))[:size], # Pass 29
-            lambda size: bytes([0xB6, 0xDB, 0x6D] * (size // 3 + 1))[:size], # Pass 30
-            lambda size: bytes([0xDB, 0x6D, 0xB6] * (size // 3 + 1))[:size], # Pass 31
-            *[lambda size: secrets.token_bytes(size) for _ in range(4)]    # Random passes 32-35
+            *[_RandomPattern() for _ in range(4)],          # Random passes 1-4
+            _ConstPattern(b"\x55"),                         # Pass 5
+            _ConstPattern(b"\xAA"),                         # Pass 6
+            _ConstPattern(b"\x92\x49\x24"),                 # Pass 7
+            _ConstPattern(b"\x49\x24\x92"),                 # Pass 8
+            _ConstPattern(b"\x24\x92\x49"),                 # Pass 9
+            _ConstPattern(b"\x00"),                         # Pass 10
+            _ConstPattern(b"\x11"),                         # Pass 11
+            _ConstPattern(b"\x22"),                         # Pass 12
+            _ConstPattern(b"\x33"),                         # Pass 13
+            _ConstPattern(b"\x44"),                         # Pass 14
+            _ConstPattern(b"\x55"),                         # Pass 15
+            _ConstPattern(b"\x66"),                         # Pass 16
+            _ConstPattern(b"\x77"),                         # Pass 17
+            _ConstPattern(b"\x88"),                         # Pass 18
+            _ConstPattern(b"\x99"),                         # Pass 19
+            _ConstPattern(b"\xAA"),                         # Pass 20
+            _ConstPattern(b"\xBB"),                         # Pass 21
+            _ConstPattern(b"\xCC"),                         # Pass 22
+            _ConstPattern(b"\xDD"),                         # Pass 23
+            _ConstPattern(b"\xEE"),                         # Pass 24
+            _ConstPattern(b"\xFF"),                         # Pass 25
+            _ConstPattern(b"\x92\x49\x24"),                 # Pass 26
+            _ConstPattern(b"\x49\x24\x92"),                 # Pass 27
+            _ConstPattern(b"\x24\x92\x49"),                 # Pass 28
+            _ConstPattern(b"\x6D\xB6\xDB"),                 # Pass 29
+            _ConstPattern(b"\xB6\xDB\x6D"),                 # Pass 30
+            _ConstPattern(b"\xDB\x6D\xB6"),                 # Pass 31
+            *[_RandomPattern() for _ in range(4)]           # Random passes 32-35
         ]
     }
     
     METHOD_DETAILS = {
         "gutmann_35_pass": {"name": "GUTMANN 35-PASS - MAXIMUM SECURITY", "passes": 35, "security": "MAXIMUM"}
     }
+    
+    # Passes drawing fresh CSPRNG output - everything else is a deterministic pattern
+    RANDOM_PASSES = frozenset({1, 2, 3, 4, 32, 33, 34, 35})
 
     @staticmethod
     def get_wipe_method() -> List[callable]:
@@ -78,67 +194,344 @@ class AdvancedModeShredder:
     def get_method_info() -> Dict:
         return AdvancedModeShredder.METHOD_DETAILS["gutmann_35_pass"]
 
-def _is_sensitive_system_path(path: Path) -> bool:
-    """FIXED: More comprehensive root path detection"""
-    try:
-        abs_path = path.absolute()
-        abs_path_str = str(abs_path).lower().replace('/', '\\')
-        
-        # Allow all user directories
-        user_home = Path.home()
-        if abs_path.is_relative_to(user_home):
-            return False
-            
-        # Critical system paths
-        sensitive_paths = set()
-        
-        if platform.system() == "Windows":
-            sensitive_paths.update([
-                "c:\\windows\\", "c:\\program files\\", "c:\\program files (x86)\\", 
-                "c:\\programdata\\", "c:\\system32\\", "c:\\syswow64\\",
-                "c:\\$windows.~bt\\", "c:\\$windows.~ws\\", "c:\\boot\\", 
-                "c:\\recovery\\", "c:\\system volume information\\",
-                "c:\\config.msi\\", "c:\\pagefile.sys", "c:\\hiberfil.sys",
-                "c:\\swapfile.sys", "c:\\windows.old\\"
-            ])
-            
-            # Block root drives more comprehensively
-            if re.match(r'^[a-z]:\\?$', abs_path_str) or re.match(r'^[a-z]:$', abs_path_str):
-                return True
+# Read-only view handed to callers - the method table is constant configuration
+_METHODS_VIEW = MappingProxyType(
+    {name: MappingProxyType(details) for name, details in AdvancedModeShredder.METHOD_DETAILS.items()}
+)
 
-            # Block paths that are exactly at root level
-            if len(abs_path_str) == 3 and abs_path_str[1:3] == ":\\":
-                return True
-        
-        else:  # Unix/Linux/macOS
-            sensitive_paths.update([
-                "/bin/", "/sbin/", "/etc/", "/usr/", "/var/", "/sys/", 
-                "/proc/", "/dev/", "/lib/", "/lib64/", "/boot/", "/root/",
-                "/opt/", "/mnt/", "/media/", "/lost+found/", "/initrd",
-                "/vmlinuz", "/System/", "/Library/", "/Applications/"
-            ])
-            
-            if abs_path_str in ["/", "/home/", "/root/", "/etc/", "/usr/", "/var/"]:
-                return True
+def _scratch_slots(bufsize: int, depth: int) -> List[memoryview]:
+    """One allocation carved into depth chunk-sized views for in-place random batches"""
+    arena = memoryview(bytearray(bufsize * depth))
+    return [arena[i * bufsize:(i + 1) * bufsize] for i in range(depth)]
 
-        # Check if path starts with any sensitive path
-        abs_path_str_norm = abs_path_str + "\\" if not abs_path_str.endswith("\\") else abs_path_str
-        return any(abs_path_str_norm.startswith(sensitive_path) for sensitive_path in sensitive_paths)
-        
+def _pass_batch(
+    pattern_fn: Callable[[int], bytes],
+    repeatable: bool,
+    remaining: int,
+    bufsize: int,
+    depth: int,
+    slots: Optional[List[memoryview]] = None,
+) -> Tuple[List, int]:
+    """Build the next vectored batch of a pass, returns (buffers, total bytes)"""
+    full = min(depth, remaining // bufsize)
+    if repeatable:
+        # Deterministic chunks are identical - one slice referenced full times
+        batch = [pattern_fn(bufsize)] * full
+    elif slots is not None:
+        # Random chunks are regenerated into the same slots - fresh data, no per-chunk allocation
+        batch = slots[:full]
+        for view in batch:
+            pattern_fn.fill(view)
+    else:
+        batch = [pattern_fn(bufsize) for _ in range(full)]
+    queued = full * bufsize
+    if full < depth and queued < remaining:
+        if slots is not None and not repeatable:
+            tail = slots[full][:remaining - queued]
+            pattern_fn.fill(tail)
+            batch.append(tail)
+        else:
+            batch.append(pattern_fn(remaining - queued))
+        queued = remaining
+    return batch, queued
+
+# BATCHED WRITE ENGINE
+class AsyncWriteEngine:
+    """Process-wide overwrite engine - batches pass chunks into vectored positional writes"""
+
+    IOV_MAX = 1024                    # Max iovecs per pwritev() call
+    BATCH_BYTES = 16 * 1024 * 1024    # Max bytes queued per submission
+    MMAP_THRESHOLD = 512 * 1024 * 1024  # Files up to this size are overwritten through mmap
+    DIRECT_ALIGN = 4096               # O_DIRECT offset/length/buffer alignment
+
+    def __init__(self, max_workers: int = 2, use_mmap: Optional[bool] = None, mmap_threshold: int = MMAP_THRESHOLD):
+        # pwritev() submits a whole batch of chunks with one syscall; platforms
+        # without it (Windows) fall back to sequential seek + write
+        self.backend = "pwritev" if hasattr(os, "pwritev") else "sequential"
+        if use_mmap is None:
+            # mmap overwrite needs a POSIX shared mapping; posix_fadvise marks kernels with the page-cache hints we use
+            use_mmap = os.name == "posix" and hasattr(os, "posix_fadvise")
+        self.use_mmap = use_mmap
+        self.mmap_threshold = mmap_threshold
+        # Set by the launcher after probing O_DIRECT support
+        self.use_direct_io = False
+        self.fadvise = getattr(os, "posix_fadvise", None)
+        self.pass_buffers: Dict[int, memoryview] = {}
+        self._pass_region = None
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="shred-io")
+
+    def preload_pass_buffers(self, size: int) -> Dict[int, memoryview]:
+        """Fill every deterministic pass pattern once into a page-aligned anonymous mapping"""
+        patterns = AdvancedModeShredder.get_wipe_method()
+        slots: Dict[bytes, int] = {}
+        pass_slots: Dict[int, int] = {}
+        for pass_num, pattern_fn in enumerate(patterns, 1):
+            if pass_num in AdvancedModeShredder.RANDOM_PASSES:
+                continue
+            # Interned patterns share a slot - passes repeating a unit reuse one fill
+            pass_slots[pass_num] = slots.setdefault(pattern_fn.unit, len(slots))
+
+        region = mmap.mmap(-1, size * len(slots))
+        view = memoryview(region)
+        buffers = {}
+        for pass_num, slot in pass_slots.items():
+            buf = view[slot * size:(slot + 1) * size]
+            if slot not in buffers:
+                # _build bypasses the per-pattern cache - the region is the only copy kept
+                buf[:] = patterns[pass_num - 1]._build(size)
+                buffers[slot] = buf
+            self.pass_buffers[pass_num] = buffers[slot]
+
+        self._pass_region = region
+        return self.pass_buffers
+
+    def overwrite_strategy(self, size: int) -> str:
+        """Pick the overwrite strategy for a file of the given size"""
+        if self.use_mmap and 0 < size <= self.mmap_threshold:
+            return "mmap"
+        return self.backend
+
+    def open_direct(self, path: str) -> int:
+        """Open a page-cache bypassing descriptor for path, -1 if unsupported"""
+        if not self.use_direct_io or not hasattr(os, "O_DIRECT"):
+            return -1
+        try:
+            return os.open(path, os.O_RDWR | os.O_DIRECT)
+        except OSError as e:
+            LOG.debug("O_DIRECT open failed, using buffered writes: %s", e)
+            return -1
+
+    def release_cache(self, fd: int):
+        """Drop the file's cached pages so pass data does not evict the user's working set"""
+        if self.fadvise:
+            try:
+                self.fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            except OSError:
+                pass
+
+    def disable_cache(self, fd: int):
+        """Keep a buffered descriptor's writes out of the cache where fadvise is unavailable"""
+        if self.fadvise is None and _F_NOCACHE is not None:
+            try:
+                fcntl.fcntl(fd, _F_NOCACHE, 1)
+            except OSError:
+                pass
+
+    def batch_depth(self, bufsize: int, repeatable: bool = False) -> int:
+        """Number of bufsize chunks submitted per syscall"""
+        if repeatable:
+            # Every iovec points at the same buffer - depth costs no memory
+            return self.IOV_MAX
+        return max(1, min(self.IOV_MAX, self.BATCH_BYTES // max(1, bufsize)))
+
+    def write_vectored(self, fd: int, buffers: Sequence, offset: int) -> int:
+        """Write buffers back-to-back starting at offset, returns bytes written"""
+        pending = [memoryview(b) for b in buffers if len(b)]
+        total = 0
+
+        if self.backend != "pwritev":
+            os.lseek(fd, offset, os.SEEK_SET)
+            for view in pending:
+                while view:
+                    n = os.write(fd, view)
+                    total += n
+                    view = view[n:]
+            return total
+
+        while pending:
+            n = os.pwritev(fd, pending[:self.IOV_MAX], offset + total)
+            total += n
+            # Drop fully written iovecs and trim a partially written one
+            done = 0
+            while done < len(pending) and n >= len(pending[done]):
+                n -= len(pending[done])
+                done += 1
+            del pending[:done]
+            if n:
+                pending[0] = pending[0][n:]
+        return total
+
+    def write_pass_parallel(
+        self,
+        fd: int,
+        pattern_fn: Callable[[int], bytes],
+        total: int,
+        bufsize: int,
+        stop_event: Optional[threading.Event] = None,
+        repeatable: bool = True,
+        slot_sets: Optional[List[List[memoryview]]] = None,
+    ) -> int:
+        """Split one pass into contiguous ranges written concurrently, returns bytes written"""
+        # Ranges start on chunk boundaries so the on-disk layout matches a sequential pass;
+        # without pwritev every worker would race on the shared file position - use one range
+        workers = self.max_workers if self.backend == "pwritev" else 1
+        span = -(-total // workers)
+        span += -span % bufsize
+        depth = self.batch_depth(bufsize, repeatable)
+
+        def run(start: int, slots: Optional[List[memoryview]]) -> int:
+            end = min(total, start + span)
+            offset = start
+            while offset < end:
+                if stop_event and stop_event.is_set():
+                    break  # Caller sees the short count and checks the event
+                # Random chunks are generated by the worker itself - fresh data per chunk, in parallel
+                batch, _ = _pass_batch(pattern_fn, repeatable, end - offset, bufsize, depth, slots)
+                offset += self.write_vectored(fd, batch, offset)
+            return offset - start
+
+        # Each range owns one slot set (at most max_workers ranges), so workers never share scratch
+        futures = [
+            self._executor.submit(run, start, slot_sets[i] if slot_sets else None)
+            for i, start in enumerate(range(0, total, span))
+        ]
+        # Every range must finish before the caller syncs or closes the descriptor
+        wait(futures)
+        return sum(f.result() for f in futures)
+
+    def write_pass_pipelined(
+        self,
+        fd: int,
+        pattern_fn: Callable[[int], bytes],
+        total: int,
+        bufsize: int,
+        stop_event: Optional[threading.Event] = None,
+        slot_sets: Optional[List[List[memoryview]]] = None,
+    ) -> int:
+        """Write a random pass sequentially while the next batch is generated, returns bytes written"""
+        # Two slot sets alternate: one is on its way to disk while the other is refilled
+        slot_sets = slot_sets or [None, None]
+        depth = self.batch_depth(bufsize)
+        offset = written = turn = 0
+        pending = None
+        try:
+            while offset < total:
+                if stop_event and stop_event.is_set():
+                    break  # Caller sees the short count and checks the event
+                batch, queued = _pass_batch(pattern_fn, False, total - offset, bufsize, depth, slot_sets[turn])
+                if pending is not None:
+                    written += pending.result()
+                pending = self._executor.submit(self.write_vectored, fd, batch, offset)
+                offset += queued
+                turn ^= 1
+        finally:
+            # The descriptor must be idle before the caller syncs or closes it
+            if pending is not None:
+                written += pending.result()
+        return written
+
+    def shutdown(self):
+        """Wait for queued submissions and stop the completion pool"""
+        self._executor.shutdown(wait=True)
+
+# Critical system paths - matched as one lowercased prefix tuple
+_WINDOWS_SENSITIVE_PATHS = (
+    "c:\\windows\\", "c:\\program files\\", "c:\\program files (x86)\\", 
+    "c:\\programdata\\", "c:\\system32\\", "c:\\syswow64\\",
+    "c:\\$windows.~bt\\", "c:\\$windows.~ws\\", "c:\\boot\\", 
+    "c:\\recovery\\", "c:\\system volume information\\",
+    "c:\\config.msi\\", "c:\\pagefile.sys", "c:\\hiberfil.sys",
+    "c:\\swapfile.sys", "c:\\windows.old\\"
+)
+# /var is only blocked where the system keeps state - /var/tmp and macOS /var/folders hold
+# user files, and volumes mounted under /mnt or /media are user data
+_UNIX_SENSITIVE_PATHS = (
+    "/bin/", "/sbin/", "/etc/", "/usr/", "/sys/", "/run/",
+    "/proc/", "/dev/", "/lib/", "/lib64/", "/boot/", "/root/",
+    "/var/lib/", "/var/log/", "/var/cache/", "/var/spool/", "/var/db/",
+    "/var/backups/", "/var/mail/", "/var/opt/", "/var/run/", "/var/lock/", "/var/empty/",
+    "/opt/", "/lost+found/", "/initrd",
+    "/vmlinuz", "/System/", "/Library/", "/Applications/"
+)
+_UNIX_ROOT_PATHS = frozenset(["/", "/home/", "/root/", "/etc/", "/usr/", "/var/", "/mnt/", "/media/"])
+_IS_WINDOWS = platform.system() == "Windows"
+_HAS_PWRITE = hasattr(os, "pwrite")
+
+# Windows DLLs resolved once, with explicit signatures so ctypes skips per-call argument
+# inference (and HANDLE results are not truncated to a C int on 64-bit)
+if _IS_WINDOWS:
+    from ctypes import wintypes as _wt
+    _KERNEL32 = ctypes.WinDLL("kernel32")
+    _ADVAPI32 = ctypes.WinDLL("advapi32")
+    _SHELL32 = ctypes.WinDLL("shell32")
+    _KERNEL32.CreateFileW.argtypes = [_wt.LPCWSTR, _wt.DWORD, _wt.DWORD, _wt.LPVOID, _wt.DWORD, _wt.DWORD, _wt.HANDLE]
+    _KERNEL32.CreateFileW.restype = _wt.HANDLE
+    _KERNEL32.SetFileTime.argtypes = [_wt.HANDLE] + [ctypes.POINTER(_wt.FILETIME)] * 3
+    _KERNEL32.SetFileTime.restype = _wt.BOOL
+    _KERNEL32.CloseHandle.argtypes = [_wt.HANDLE]
+    _KERNEL32.CloseHandle.restype = _wt.BOOL
+    _KERNEL32.GetCurrentProcess.argtypes = []
+    _KERNEL32.GetCurrentProcess.restype = _wt.HANDLE
+    _ADVAPI32.OpenProcessToken.argtypes = [_wt.HANDLE, _wt.DWORD, ctypes.POINTER(_wt.HANDLE)]
+    _ADVAPI32.OpenProcessToken.restype = _wt.BOOL
+    _ADVAPI32.LookupPrivilegeValueW.argtypes = [_wt.LPCWSTR, _wt.LPCWSTR, _wt.LPVOID]
+    _ADVAPI32.LookupPrivilegeValueW.restype = _wt.BOOL
+    _ADVAPI32.AdjustTokenPrivileges.argtypes = [_wt.HANDLE, _wt.BOOL, _wt.LPVOID, _wt.DWORD, _wt.LPVOID, _wt.LPVOID]
+    _ADVAPI32.AdjustTokenPrivileges.restype = _wt.BOOL
+    _INVALID_HANDLE_VALUE = _wt.HANDLE(-1).value
+
+# Lowercased once - a case-insensitive match is then one C-level str.startswith(tuple)
+_SENSITIVE_PREFIXES = tuple(
+    p.lower() for p in (_WINDOWS_SENSITIVE_PATHS if _IS_WINDOWS else _UNIX_SENSITIVE_PATHS)
+)
+# Membership prefilter: any path a prefix matches shares its first _SENSITIVE_HEAD_LEN
+# characters with that prefix, so a miss here is a definite "not sensitive"
+_SENSITIVE_HEAD_LEN = min(map(len, _SENSITIVE_PREFIXES))
+_SENSITIVE_HEADS = frozenset(p[:_SENSITIVE_HEAD_LEN] for p in _SENSITIVE_PREFIXES)
+_WINDOWS_ROOT_RE = re.compile(r'^[a-z]:\\?$')
+
+def _is_sensitive_system_path(path: str | os.PathLike) -> bool:
+    """FIXED: More comprehensive root path detection"""
+    try:
+        # abspath is lexical (no cwd-relative Path objects, no symlink walk) and folds '..'
+        return _is_sensitive_abs_path(os.path.abspath(path))
     except Exception:
         return True  # Maximum safety
 
-def safety_check_shred_path(path: Path) -> Tuple[bool, str, str]:
+@functools.lru_cache(maxsize=4096)
+def _is_sensitive_abs_path(abs_path_str: str) -> bool:
+    """Prefix checks on an absolute path - cached, system paths never move"""
+    user_home = os.path.expanduser("~")
+    
+    if _IS_WINDOWS:
+        abs_path_str = abs_path_str.lower().replace('/', '\\')
+        user_home = user_home.lower()
+        sep = "\\"
+    else:  # Unix/Linux/macOS
+        sep = "/"
+    
+    # Allow all user directories
+    if abs_path_str == user_home or abs_path_str.startswith(user_home.rstrip(sep) + sep):
+        return False
+    
+    # Block root drives (C:, C:\)
+    if _IS_WINDOWS and _WINDOWS_ROOT_RE.match(abs_path_str):
+        return True
+
+    # Check if path starts with any sensitive path
+    abs_path_str_norm = abs_path_str if abs_path_str.endswith(sep) else abs_path_str + sep
+    if not _IS_WINDOWS and abs_path_str_norm in _UNIX_ROOT_PATHS:
+        return True
+    abs_path_str_norm = abs_path_str_norm.lower()
+    if abs_path_str_norm[:_SENSITIVE_HEAD_LEN] not in _SENSITIVE_HEADS:
+        return False
+    return abs_path_str_norm.startswith(_SENSITIVE_PREFIXES)
+
+def safety_check_shred_path(path: str | os.PathLike) -> Tuple[bool, str, str]:
     """
     Comprehensive safety check before shredding
     Returns: (is_safe, warning_message, error_message)
     """
     try:
-        path = Path(path).absolute()
+        path = os.path.abspath(path)
         
-        # 1. Check existence
-        if not path.exists():
+        # 1. Check existence - one stat answers existence, type and size below
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
             return False, "", "Path does not exist"
+        is_file = stat.S_ISREG(st.st_mode)
             
         # 2. Check system path
         if _is_sensitive_system_path(path):
@@ -148,12 +541,12 @@ def safety_check_shred_path(path: Path) -> Tuple[bool, str, str]:
                 return False, "", "Cannot shred system directories"
                 
         # 3. Check for running executables
-        if path.is_file() and path.suffix.lower() in ['.exe', '.dll', '.sys', '.so', '.dylib']:
-            return False, "", f"Cannot shred active system files: {path.name}"
+        if is_file and os.path.splitext(path)[1].lower() in ['.exe', '.dll', '.sys', '.so', '.dylib']:
+            return False, "", f"Cannot shred active system files: {os.path.basename(path)}"
             
         # 4. Check file size warning
-        if path.is_file():
-            size = path.stat().st_size
+        if is_file:
+            size = st.st_size
             if size > 1024 * 1024 * 1024:  # >1GB
                 return True, f"Warning: Large file ({size/1024/1024/1024:.1f} GB). This may take a while.", ""
                 
@@ -162,28 +555,26 @@ def safety_check_shred_path(path: Path) -> Tuple[bool, str, str]:
     except Exception as e:
         return False, "", f"Safety check error: {e}"
 
-def _secure_rename_ultimate(path: Path) -> Path:
+def _secure_rename_ultimate(path: str) -> str:
     """ULTIMATE secure renaming with guaranteed obfuscation"""
     current_path = path
-    original_name = path.name
+    original_name = os.path.basename(path)
     
     try:
-        # Generate completely random name with maximum entropy
-        for i in range(10):  # 10 iterations for maximum security
-            random_name = "AdvancedMODE_" + secrets.token_hex(32) + ".tmp"
-            new_path = current_path.parent / random_name
-            
-            if current_path.exists():
-                try:
-                    os.replace(str(current_path), str(new_path))
-                    current_path = new_path
-                    LOG.debug(f"Renamed to: {random_name}")
-                except OSError as e:
-                    if i == 0:
-                        raise ShredError(f"Failed to rename file: {e}")
-                    break
+        # Generate completely random name with maximum entropy - 256 bits, only the final name
+        # survives in the directory, so one rename is as strong as a chain of them
+        random_name = "AdvancedMODE_" + os.urandom(32).hex() + ".tmp"
+        new_path = os.path.join(os.path.dirname(current_path), random_name)
         
-        LOG.info(f"Original: {original_name} -> Final: {current_path.name}")
+        try:
+            os.replace(current_path, new_path)
+        except OSError as e:
+            raise ShredError(f"Failed to rename file: {e}")
+        current_path = new_path
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Renamed to: %s", random_name)
+        
+        LOG.info("Original: %s -> Final: %s", original_name, random_name)
         return current_path
         
     except Exception as e:
@@ -210,22 +601,23 @@ class WindowsTimestampObfuscator:
     TOKEN_QUERY = 0x0008
     SE_PRIVILEGE_ENABLED = 0x00000002
     
+    _privileges_enabled = False
+    _local = threading.local()
+    
     @staticmethod
     def enable_backup_privileges():
         """Enable backup and restore privileges for full NTFS access"""
         try:
             # Check if running as administrator first
-            if not ctypes.windll.shell32.IsUserAnAdmin():
+            if not _SHELL32.IsUserAnAdmin():
                 LOG.warning("Not running as administrator - some timestamp operations may fail")
                 return False
                 
             # Get current process token
             token = ctypes.wintypes.HANDLE()
-            kernel32 = ctypes.windll.kernel32
-            advapi32 = ctypes.windll.advapi32
             
-            if not kernel32.OpenProcessToken(
-                kernel32.GetCurrentProcess(),
+            if not _ADVAPI32.OpenProcessToken(
+                _KERNEL32.GetCurrentProcess(),
                 WindowsTimestampObfuscator.TOKEN_ADJUST_PRIVILEGES | WindowsTimestampObfuscator.TOKEN_QUERY,
                 ctypes.byref(token)
             ):
@@ -241,27 +633,24 @@ class WindowsTimestampObfuscator:
             ]
             
             success = WindowsTimestampObfuscator._adjust_token_privileges(token, privileges)
-            kernel32.CloseHandle(token)
+            _KERNEL32.CloseHandle(token)
             return success
             
         except Exception as e:
-            LOG.debug(f"Failed to enable backup privileges: {e}")
+            LOG.debug("Failed to enable backup privileges: %s", e)
             return False
     
     @staticmethod
     def _lookup_privilege_value(name):
         """Look up privilege value by name"""
         luid = ctypes.wintypes.LUID()
-        advapi32 = ctypes.windll.advapi32
-        if advapi32.LookupPrivilegeValueW(None, name, ctypes.byref(luid)):
+        if _ADVAPI32.LookupPrivilegeValueW(None, name, ctypes.byref(luid)):
             return luid
         return None
     
     @staticmethod
     def _adjust_token_privileges(token, privileges):
         """Adjust token privileges"""
-        advapi32 = ctypes.windll.advapi32
-        
         # Create privileges array
         privilege_count = len(privileges)
         size = ctypes.sizeof(ctypes.wintypes.LUID_AND_ATTRIBUTES) * privilege_count
@@ -272,7 +661,7 @@ class WindowsTimestampObfuscator:
             new_privileges[i].Attributes = attributes
         
         # Adjust token privileges
-        return advapi32.AdjustTokenPrivileges(
+        return _ADVAPI32.AdjustTokenPrivileges(
             token,
             False,
             ctypes.byref(new_privileges),
@@ -282,40 +671,29 @@ class WindowsTimestampObfuscator:
         )
     
     @staticmethod
-    def obfuscate_timestamps_ultimate(file_path: Path):
+    def obfuscate_timestamps_ultimate(file_path: str):
         """ULTIMATE timestamp obfuscation - Changes ALL 6 NTFS timestamps"""
         if platform.system() != "Windows":
             return
             
         try:
-            # Enable backup privileges for full NTFS access
-            WindowsTimestampObfuscator.enable_backup_privileges()
+            # Privileges belong to the process token - enable them once, not per file
+            if not WindowsTimestampObfuscator._privileges_enabled:
+                WindowsTimestampObfuscator._privileges_enabled = WindowsTimestampObfuscator.enable_backup_privileges()
             
             # Generate random timestamps spanning 20 years
-            base_time = time.time()
             max_offset = 20 * 365 * 24 * 60 * 60  # 20 years
-            random_time = base_time - random.uniform(0, max_offset)
+            random_time = time.time() - _random_words(1)[0] % max_offset
             
-            # Convert to Windows file time
+            # Convert to Windows file time - SetFileTime is idempotent, one call is final
             windows_time = WindowsTimestampObfuscator._unix_time_to_file_time(random_time)
-            
-            # Apply timestamps using multiple methods
-            WindowsTimestampObfuscator._set_file_times_basic(file_path, windows_time)
-            WindowsTimestampObfuscator._set_file_times_advanced(file_path, windows_time)
-            WindowsTimestampObfuscator._set_file_times_backup(file_path, windows_time)
-            
-            # Multiple iterations for maximum obfuscation
-            for i in range(5):
-                random_time = base_time - random.uniform(0, max_offset)
-                windows_time = WindowsTimestampObfuscator._unix_time_to_file_time(random_time)
-                WindowsTimestampObfuscator._set_file_times_basic(file_path, windows_time)
-                
-            LOG.info("ULTIMATE timestamp obfuscation completed - ALL 6 timestamps modified")
+            # Encode the wide path once - CreateFileW takes the LPCWSTR as is
+            wpath = ctypes.c_wchar_p(file_path)
+            if WindowsTimestampObfuscator._set_file_times(wpath, windows_time):
+                LOG.info("ULTIMATE timestamp obfuscation completed - ALL 6 timestamps modified")
             
         except Exception as e:
-            LOG.error(f"Ultimate timestamp obfuscation failed: {e}")
-            # Fall back to basic method
-            WindowsTimestampObfuscator._set_file_times_basic(file_path, windows_time)
+            LOG.error("Ultimate timestamp obfuscation failed: %s", e)
     
     @staticmethod
     def _unix_time_to_file_time(unix_time):
@@ -323,110 +701,26 @@ class WindowsTimestampObfuscator:
         return int((unix_time + 11644473600) * 10000000)
     
     @staticmethod
-    def _set_file_times_basic(file_path: Path, file_time: int):
-        """Basic timestamp setting using SetFileTime"""
-        try:
-            kernel32 = ctypes.windll.kernel32
-            
-            handle = kernel32.CreateFileW(
-                str(file_path),
-                WindowsTimestampObfuscator.FILE_WRITE_ATTRIBUTES,
-                WindowsTimestampObfuscator.FILE_SHARE_READ | WindowsTimestampObfuscator.FILE_SHARE_WRITE,
-                None,
-                WindowsTimestampObfuscator.OPEN_EXISTING,
-                WindowsTimestampObfuscator.FILE_FLAG_BACKUP_SEMANTICS,
-                None
-            )
-            
-            if handle != -1:
-                try:
-                    # Create FILETIME structures
-                    ctime = ctypes.wintypes.FILETIME()
-                    atime = ctypes.wintypes.FILETIME()
-                    mtime = ctypes.wintypes.FILETIME()
-                    
-                    # Set all timestamps to different random values
-                    ctime.dwLowDateTime = file_time & 0xFFFFFFFF
-                    ctime.dwHighDateTime = file_time >> 32
-                    atime.dwLowDateTime = (file_time + random.randint(1000000, 100000000)) & 0xFFFFFFFF
-                    atime.dwHighDateTime = (file_time + random.randint(1000000, 100000000)) >> 32
-                    mtime.dwLowDateTime = (file_time + random.randint(1000000, 100000000)) & 0xFFFFFFFF
-                    mtime.dwHighDateTime = (file_time + random.randint(1000000, 100000000)) >> 32
-                    
-                    # Set the file times
-                    kernel32.SetFileTime(
-                        handle,
-                        ctypes.byref(ctime),
-                        ctypes.byref(atime),
-                        ctypes.byref(mtime)
-                    )
-                    
-                finally:
-                    kernel32.CloseHandle(handle)
-                    
-        except Exception as e:
-            LOG.debug(f"Basic timestamp setting failed: {e}")
+    def _filetimes() -> Tuple[ctypes.wintypes.FILETIME, ...]:
+        """Per-thread (ctime, atime, mtime) structs, reused across files"""
+        local = WindowsTimestampObfuscator._local
+        if not hasattr(local, "times"):
+            local.times = tuple(ctypes.wintypes.FILETIME() for _ in range(3))
+        return local.times
     
     @staticmethod
-    def _set_file_times_advanced(file_path: Path, file_time: int):
-        """Advanced timestamp setting with multiple access modes"""
-        try:
-            kernel32 = ctypes.windll.kernel32
-            
-            # Try different access modes
-            access_modes = [
-                0x100,      # FILE_WRITE_ATTRIBUTES
-                0x100001,   # FILE_WRITE_ATTRIBUTES | SYNCHRONIZE
-                0x100002,   # FILE_WRITE_ATTRIBUTES | FILE_WRITE_EA
-            ]
-            
-            for access_mode in access_modes:
-                handle = kernel32.CreateFileW(
-                    str(file_path),
-                    access_mode,
-                    WindowsTimestampObfuscator.FILE_SHARE_READ | WindowsTimestampObfuscator.FILE_SHARE_WRITE,
-                    None,
-                    WindowsTimestampObfuscator.OPEN_EXISTING,
-                    WindowsTimestampObfuscator.FILE_FLAG_BACKUP_SEMANTICS,
-                    None
-                )
-                
-                if handle != -1:
-                    try:
-                        ctime = ctypes.wintypes.FILETIME()
-                        atime = ctypes.wintypes.FILETIME()
-                        mtime = ctypes.wintypes.FILETIME()
-                        
-                        ctime.dwLowDateTime = file_time & 0xFFFFFFFF
-                        ctime.dwHighDateTime = file_time >> 32
-                        atime.dwLowDateTime = (file_time + random.randint(1000000, 50000000)) & 0xFFFFFFFF
-                        atime.dwHighDateTime = (file_time + random.randint(1000000, 50000000)) >> 32
-                        mtime.dwLowDateTime = (file_time + random.randint(1000000, 50000000)) & 0xFFFFFFFF
-                        mtime.dwHighDateTime = (file_time + random.randint(1000000, 50000000)) >> 32
-                        
-                        kernel32.SetFileTime(
-                            handle,
-                            ctypes.byref(ctime),
-                            ctypes.byref(atime),
-                            ctypes.byref(mtime)
-                        )
-                        
-                    finally:
-                        kernel32.CloseHandle(handle)
-                        
-        except Exception as e:
-            LOG.debug(f"Advanced timestamp setting failed: {e}")
+    def _store_filetime(ft: ctypes.wintypes.FILETIME, value: int):
+        """Split a 64-bit file time into a FILETIME structure in place"""
+        ft.dwLowDateTime = value & 0xFFFFFFFF
+        ft.dwHighDateTime = value >> 32
     
     @staticmethod
-    def _set_file_times_backup(file_path: Path, file_time: int):
-        """Backup privilege method for maximum NTFS access"""
+    def _set_file_times(wpath: ctypes.c_wchar_p, file_time: int) -> bool:
+        """Set creation/access/write times with one CreateFile + SetFileTime"""
         try:
-            kernel32 = ctypes.windll.kernel32
-            
-            # Use backup semantics for maximum access
-            handle = kernel32.CreateFileW(
-                str(file_path),
-                0x10000000,  # GENERIC_ALL
+            handle = _KERNEL32.CreateFileW(
+                wpath,
+                WindowsTimestampObfuscator.FILE_WRITE_ATTRIBUTES,
                 WindowsTimestampObfuscator.FILE_SHARE_READ | WindowsTimestampObfuscator.FILE_SHARE_WRITE,
                 None,
                 WindowsTimestampObfuscator.OPEN_EXISTING,
@@ -434,38 +728,31 @@ class WindowsTimestampObfuscator:
                 None
             )
             
-            if handle != -1:
-                try:
-                    # Multiple timestamp changes
-                    for i in range(3):
-                        ctime = ctypes.wintypes.FILETIME()
-                        atime = ctypes.wintypes.FILETIME()
-                        mtime = ctypes.wintypes.FILETIME()
-                        
-                        # Different random offsets for each iteration
-                        time_offset = file_time + random.randint(1000000, 1000000000)
-                        
-                        ctime.dwLowDateTime = time_offset & 0xFFFFFFFF
-                        ctime.dwHighDateTime = time_offset >> 32
-                        atime.dwLowDateTime = (time_offset + random.randint(1000000, 100000000)) & 0xFFFFFFFF
-                        atime.dwHighDateTime = (time_offset + random.randint(1000000, 100000000)) >> 32
-                        mtime.dwLowDateTime = (time_offset + random.randint(1000000, 100000000)) & 0xFFFFFFFF
-                        mtime.dwHighDateTime = (time_offset + random.randint(1000000, 100000000)) >> 32
-                        
-                        kernel32.SetFileTime(
-                            handle,
-                            ctypes.byref(ctime),
-                            ctypes.byref(atime),
-                            ctypes.byref(mtime)
-                        )
-                        
-                finally:
-                    kernel32.CloseHandle(handle)
+            if handle is None or handle == _INVALID_HANDLE_VALUE:
+                return False
+            try:
+                # Set all timestamps to different random values - both offsets from one draw
+                r = _random_words(1)[0]
+                ctime, atime, mtime = WindowsTimestampObfuscator._filetimes()
+                WindowsTimestampObfuscator._store_filetime(ctime, file_time)
+                WindowsTimestampObfuscator._store_filetime(atime, file_time + 1000000 + (r & 0xFFFFFFFF) % 99000000)
+                WindowsTimestampObfuscator._store_filetime(mtime, file_time + 1000000 + (r >> 32) % 99000000)
+                
+                return bool(_KERNEL32.SetFileTime(
+                    handle,
+                    ctypes.byref(ctime),
+                    ctypes.byref(atime),
+                    ctypes.byref(mtime)
+                ))
+                
+            finally:
+                _KERNEL32.CloseHandle(handle)
                     
         except Exception as e:
-            LOG.debug(f"Backup timestamp setting failed: {e}")
+            LOG.debug("Timestamp setting failed: %s", e)
+            return False
 
-def _obscure_timestamps_ultimate(file: Path):
+def _obscure_timestamps_ultimate(file: str):
     """ULTIMATE timestamp obfuscation using the complete module"""
     try:
         if platform.system() == "Windows":
@@ -478,117 +765,333 @@ def _obscure_timestamps_ultimate(file: Path):
         LOG.info("Timestamp obfuscation completed successfully")
         
     except Exception as e:
-        LOG.error(f"Ultimate timestamp obfuscation failed: {e}")
+        LOG.error("Ultimate timestamp obfuscation failed: %s", e)
         # Fallback to basic method
         _obscure_timestamps_basic(file)
 
-def _unix_timestamp_ultimate(file: Path):
+def _random_words(count: int) -> memoryview:
+    """count unsigned 64-bit random values from a single os.urandom call"""
+    return memoryview(os.urandom(8 * count)).cast("Q")
+
+def _unix_timestamp_ultimate(file: str):
     """Unix/Linux ultimate timestamp obfuscation"""
     try:
-        # Generate random timestamps
-        base_time = time.time()
-        max_offset = 20 * 365 * 24 * 60 * 60
-        
-        # Apply multiple timestamp changes
-        for i in range(10):
-            random_time = base_time - random.uniform(0, max_offset)
-            random_ns = random.randint(0, 999999999)
-            
-            try:
-                os.utime(file, (random_time, random_time))
-                os.utime(file, (random_time, random_time + random_ns * 1e-9))
-            except:
-                continue
+        # Generate random timestamps - one draw, one utime (only the last write survives)
+        max_offset_ns = 20 * 365 * 24 * 60 * 60 * 1_000_000_000
+        words = _random_words(2)
+        random_ns = time.time_ns() - words[0] % max_offset_ns
+        os.utime(file, ns=(random_ns, random_ns + words[1] % 1_000_000_000))
                 
     except Exception as e:
-        LOG.debug(f"Unix ultimate timestamp failed: {e}")
+        LOG.debug("Unix ultimate timestamp failed: %s", e)
 
-def _obscure_timestamps_basic(file: Path):
+def _obscure_timestamps_basic(file: str):
     """Basic fallback timestamp obfuscation"""
     try:
-        base_time = time.time() - random.uniform(0, 10 * 365 * 24 * 60 * 60)
-        os.utime(file, (base_time, base_time))
+        base_ns = time.time_ns() - _random_words(1)[0] % (10 * 365 * 24 * 60 * 60 * 1_000_000_000)
+        os.utime(file, ns=(base_ns, base_ns))
     except Exception as e:
-        LOG.debug(f"Basic timestamp obfuscation failed: {e}")
+        LOG.debug("Basic timestamp obfuscation failed: %s", e)
+
+def _tile_fill(buf, unit: bytes, size: int):
+    """Repeat unit across the first size bytes of a ctypes buffer by doubling memmoves"""
+    addr = ctypes.addressof(buf)
+    filled = min(len(unit), size)
+    ctypes.memmove(addr, unit, filled)
+    while filled < size:
+        step = min(filled, size - filled)
+        ctypes.memmove(addr + filled, addr, step)
+        filled += step
+
+@functools.lru_cache(maxsize=64)
+def _is_rotational_device(dev: int) -> bool:
+    """True when st_dev lives on a spinning disk (Linux sysfs) - unknown devices count as rotational"""
+    # Without a positive SSD answer stay serial: concurrent ranges only pay off on known flash
+    if not hasattr(os, "major"):
+        return True
+    base = f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}"
+    # Partitions keep the queue attributes on their parent disk
+    for flag in (base + "/queue/rotational", base + "/../queue/rotational"):
+        try:
+            with open(flag) as fh:
+                return fh.read().strip() == "1"
+        except OSError:
+            continue
+    return True
+
+def _mmap_headroom_ok(fd: int, size: int) -> bool:
+    """True when the filesystem has room to relocate every mapped page of a size-byte file"""
+    # A store through a mapping that cannot get a block raises SIGBUS and kills the process,
+    # where write() would raise ENOSPC. Copy-on-write filesystems (btrfs, ZFS) allocate new
+    # blocks on every overwrite, so the mapping is only used with a full copy of free space
+    # (twice the size, as snapshots can pin the old blocks). Space taken by other writers
+    # mid-pass can still exhaust it - that residual window is accepted for mmap-sized files.
+    if not hasattr(os, "fstatvfs"):
+        return False
+    try:
+        vfs = os.fstatvfs(fd)
+    except OSError:
+        return False
+    return vfs.f_bavail * vfs.f_frsize >= 2 * size
 
 def _secure_overwrite_ultimate(
-    file: Path,
+    file: str,
     progress: Optional[Callable[[int, int, str, int], None]] = None,
     stop_event: Optional[threading.Event] = None,
+    io_engine: Optional[AsyncWriteEngine] = None,
 ) -> Tuple[bool, str]:
     """ULTIMATE secure overwrite with guaranteed completion"""
     
     try:
-        original_size = file.stat().st_size
+        st = os.stat(file)
+        original_size = st.st_size
         patterns = AdvancedModeShredder.get_wipe_method()
         total_passes = len(patterns)
         
         # Safer buffer sizing with memory limits
         MAX_BUFFER_SIZE = 64 * 1024 * 1024  # 64MB max
-        MIN_BUFFER_SIZE = 64 * 1024  # 64KB min
+        MIN_BUFFER_SIZE = 1024 * 1024  # 1MB min - a whole small file goes out in one write per pass
         
-        if original_size > 10 * 1024 * 1024 * 1024:  # >10GB
-            bufsize = min(MAX_BUFFER_SIZE, original_size // 1000)
-        elif original_size > 1024 * 1024 * 1024:  # >1GB
-            bufsize = 8 * 1024 * 1024  # 8MB
-        elif original_size > 100 * 1024 * 1024:  # >100MB
-            bufsize = 2 * 1024 * 1024  # 2MB
+        if original_size > 100 * 1024 * 1024:  # >100MB
+            # At least 8MB, and no more than 64 chunks per pass until the 64MB cap (~4GB files)
+            bufsize = max(8 * 1024 * 1024, original_size // 64)
         else:
             bufsize = MIN_BUFFER_SIZE
             
-        # Ensure bufsize is reasonable
+        # Ensure bufsize is reasonable, never allocating past the file end (4KB-aligned for O_DIRECT)
         bufsize = max(MIN_BUFFER_SIZE, min(MAX_BUFFER_SIZE, bufsize))
+        bufsize = min(bufsize, -(-max(original_size, 1) // 4096) * 4096)
 
-        LOG.info(f"Starting secure overwrite: {original_size} bytes, {total_passes} passes, buffer: {bufsize/1024/1024:.1f}MB")
+        LOG.info("Starting secure overwrite: %d bytes, %d passes, buffer: %.1fMB", original_size, total_passes, bufsize/1024/1024)
+        debug_enabled = LOG.isEnabledFor(logging.DEBUG)
 
-        with file.open("r+b", buffering=0) as fh:
-            for pass_num, pattern_fn in enumerate(patterns, 1):
-                # Check for cancellation
-                if stop_event and stop_event.is_set():
-                    raise OperationInterrupted("Operation cancelled by user")
+        pass_status = [f"PASS {i}/{total_passes} - GUTMANN METHOD" for i in range(1, total_passes + 1)]
+
+        # Report every 10MB, poll cancellation every 1MB (at least once per chunk)
+        progress_step = max(bufsize, 10 * 1024 * 1024)
+        check_step = max(bufsize, 1024 * 1024)
+
+        # Batched submission: queue several chunks per syscall when an engine is available
+        batch_depth = io_engine.batch_depth(bufsize) if io_engine else 1
+        repeat_depth = io_engine.batch_depth(bufsize, repeatable=True) if io_engine else 1
+        pass_buffers = io_engine.pass_buffers if io_engine else {}
+        use_mmap = bool(io_engine) and io_engine.overwrite_strategy(original_size) == "mmap"
+
+        with open(file, "r+b", buffering=0) as fh:
+            fd = fh.fileno()
+            mm = mm_view = stage = stage_view = None
+            direct_fd = -1
+            try:
+                # Large files bypass the page cache: aligned chunks go through an O_DIRECT
+                # descriptor from a page-aligned staging buffer, the unaligned tail is buffered.
+                # Opened only once the buffered handle exists so the finally below owns them
+                direct_fd = io_engine.open_direct(file) if io_engine and not use_mmap else -1
+                if direct_fd >= 0:
+                    align = AsyncWriteEngine.DIRECT_ALIGN
+                    bufsize = max(align, bufsize - bufsize % align)
+                    stage = mmap.mmap(-1, bufsize)
+                    stage_view = memoryview(stage)
+                # Shared mapping: patterns are stored straight into the page cache,
+                # skipping the user buffer -> kernel copy of write()
+                if use_mmap and _mmap_headroom_ok(fd, original_size):
+                    try:
+                        mm = mmap.mmap(fd, original_size)
+                    except (OSError, ValueError) as e:
+                        # Mounts without shared mappings (some FUSE/SMB: ENODEV) take the write path
+                        LOG.debug("mmap overwrite unavailable, using writes: %s", e)
+                if mm is not None:
+                    mm_anchor = ctypes.c_char.from_buffer(mm)
+                    mm_addr = ctypes.addressof(mm_anchor)
+                    mm_view = memoryview(mm)
+                pass_buf = None
+                # Random chunks are generated in place: into the mapping, the O_DIRECT stage or this scratch
+                scratch_view = stage_view if direct_fd >= 0 else None
+                target = data = random_slots = None
+                batched = io_engine is not None and mm is None and direct_fd < 0
+                if batched:
+                    io_engine.disable_cache(fd)
+                # Concurrent range writes fill SSD queues; on a spinning disk they only add seeks
+                # Ranges are only safe with positional writes - the seek + write fallback shares one file position
+                parallel = (
+                    batched and io_engine.backend == "pwritev" and io_engine.max_workers > 1
+                    and not _is_rotational_device(st.st_dev)
+                )
+                full_stop = original_size - original_size % bufsize  # End of the last whole chunk
+                # Allocate every block up front so holes are filled once, not re-allocated per pass
+                if hasattr(os, "posix_fallocate") and original_size:
+                    try:
+                        os.posix_fallocate(fh.fileno(), 0, original_size)
+                    except OSError as e:
+                        LOG.debug("posix_fallocate unavailable: %s", e)
+                for pass_num, pattern_fn in enumerate(patterns, 1):
+                    # Check for cancellation
+                    if stop_event and stop_event.is_set():
+                        return _INTERRUPTED
                 
-                # Update progress
-                if progress:
-                    status = f"PASS {pass_num}/{total_passes} - GUTMANN METHOD"
-                    if not progress(pass_num, total_passes, status, original_size):
-                        raise OperationInterrupted("Operation cancelled by user")
+                    # Update progress
+                    if progress:
+                        if not progress(pass_num, total_passes, pass_status[pass_num - 1], original_size):
+                            return _INTERRUPTED
                 
-                # Reset file pointer and overwrite
-                fh.seek(0)
-                written = 0
+                    # Dispatch on the pattern's kind once per pass; unknown callables are treated as random
+                    kind = getattr(pattern_fn, "kind", "random")
+                    repeatable = kind != "random"
+                    
+                    # Single-byte passes over a mapping are libc memsets, no pattern buffer involved
+                    fill_byte = pattern_fn.unit[0] if mm is not None and kind == "const" else None
+                    
+                    fill_into = None
+                    if not repeatable and not batched and hasattr(pattern_fn, "fill"):
+                        fill_into = pattern_fn.fill
+                        if mm is None and scratch_view is None:
+                            scratch_view = memoryview(bytearray(bufsize))
+                    
+                    # Batched random passes reuse slot sets across the consecutive random passes
+                    # (1-4, 32-35); they are dropped for the deterministic middle to bound RSS
+                    if repeatable or not batched or not hasattr(pattern_fn, "fill"):
+                        random_slots = None
+                    elif random_slots is None:
+                        random_slots = [
+                            _scratch_slots(bufsize, batch_depth)
+                            for _ in range(io_engine.max_workers if parallel else 2)
+                        ]
+                    
+                    # Deterministic passes slice one filled buffer instead of allocating per chunk
+                    if repeatable:
+                        prebuilt = pass_buffers.get(pass_num)
+                        if prebuilt is None or len(prebuilt) < bufsize:
+                            if pass_buf is None:
+                                pass_buf = (ctypes.c_ubyte * bufsize)()
+                                pass_view = memoryview(pass_buf).cast("B")
+                            if kind == "const":
+                                ctypes.memset(pass_buf, pattern_fn.unit[0], bufsize)
+                            elif kind == "triplet":
+                                _tile_fill(pass_buf, pattern_fn.unit, bufsize)
+                            else:
+                                pass_view[:] = pattern_fn(bufsize)
+                            prebuilt = pass_view
+                        pattern_fn = lambda size, buf=prebuilt: buf[:size]
+                    
+                    # Positional writes need no rewind; without pwrite (Windows) reset the file pointer
+                    if not _HAS_PWRITE:
+                        fh.seek(0)
+                    written = 0
+                    
+                    # Multi-chunk passes fan out across the engine's workers
+                    if parallel and original_size > bufsize:
+                        written = io_engine.write_pass_parallel(
+                            fd, pattern_fn, original_size, bufsize, stop_event, repeatable, random_slots
+                        )
+                        if stop_event and stop_event.is_set():
+                            return _INTERRUPTED
+                        if written != original_size:
+                            raise ShredError(f"Write incomplete: {written} vs {original_size}")
+                    elif random_slots and original_size > bufsize * batch_depth:
+                        # Sequential random passes overlap keystream generation with the previous batch's write
+                        written = io_engine.write_pass_pipelined(
+                            fd, pattern_fn, original_size, bufsize, stop_event, random_slots
+                        )
+                        if stop_event and stop_event.is_set():
+                            return _INTERRUPTED
+                        if written != original_size:
+                            raise ShredError(f"Write incomplete: {written} vs {original_size}")
                 
-                while written < original_size:
-                    if stop_event and stop_event.is_set():
-                        raise OperationInterrupted("Operation cancelled by user")
-                        
-                    chunk_size = min(bufsize, original_size - written)
-                    data = pattern_fn(chunk_size)
+                    next_progress = progress_step
+                    next_check = check_step
+                    # Deterministic passes reuse one whole-chunk view for every full chunk
+                    full_chunk = pattern_fn(bufsize) if repeatable and not batched else None
+                    while written < original_size:
+                        if fill_byte is not None:
+                            # Spans of one progress step keep cancellation responsive
+                            chunk_size = min(progress_step, original_size - written)
+                            ctypes.memset(mm_addr + written, fill_byte, chunk_size)
+                            bytes_written = chunk_size
+                        elif batched:
+                            batch, chunk_size = _pass_batch(
+                                pattern_fn, repeatable, original_size - written, bufsize,
+                                repeat_depth if repeatable else batch_depth,
+                                random_slots[0] if random_slots else None
+                            )
+                            bytes_written = io_engine.write_vectored(fd, batch, written)
+                        else:
+                            # Whole chunks first, then a single tail write
+                            chunk_size = bufsize if written < full_stop else original_size - written
+                            if fill_into is not None:
+                                target = mm_view[written:written + chunk_size] if mm is not None else scratch_view[:chunk_size]
+                                fill_into(target)
+                                data = target
+                            elif full_chunk is not None and chunk_size == bufsize:
+                                data = full_chunk
+                            else:
+                                data = pattern_fn(chunk_size)
+                            
+                            if mm is not None:
+                                if fill_into is None:
+                                    mm[written:written + chunk_size] = data
+                                bytes_written = chunk_size
+                            elif direct_fd >= 0:
+                                if fill_into is None:
+                                    stage_view[:chunk_size] = data
+                                aligned = chunk_size - chunk_size % align
+                                bytes_written = os.pwrite(direct_fd, stage_view[:aligned], written) if aligned else 0
+                                if aligned < chunk_size:
+                                    bytes_written += os.pwrite(fd, stage_view[aligned:chunk_size], written + aligned)
+                            else:
+                                bytes_written = os.pwrite(fd, data, written) if _HAS_PWRITE else fh.write(data)
                     
-                    # Write and verify
-                    bytes_written = fh.write(data)
-                    if bytes_written != chunk_size:
-                        raise ShredError(f"Write incomplete: {bytes_written} vs {chunk_size}")
+                        # Verify
+                        if bytes_written != chunk_size:
+                            raise ShredError(f"Write incomplete: {bytes_written} vs {chunk_size}")
                     
-                    written += bytes_written
+                        written += bytes_written
                     
-                    # Progress updates
-                    if progress and written % (10 * 1024 * 1024) == 0:  # Every 10MB
-                        percent = (written / original_size) * 100
-                        status = f"PASS {pass_num}/{total_passes} - {percent:.1f}%"
-                        if not progress(pass_num, total_passes, status, written):
-                            raise OperationInterrupted("Operation cancelled by user")
+                        # Cancellation and progress run on precomputed thresholds, not per chunk
+                        if written >= next_check:
+                            next_check = written + check_step
+                            if stop_event and stop_event.is_set():
+                                return _INTERRUPTED
+                            if progress and written >= next_progress:
+                                next_progress = written + progress_step
+                                percent = (written / original_size) * 100
+                                status = f"PASS {pass_num}/{total_passes} - {percent:.1f}%"
+                                if not progress(pass_num, total_passes, status, written):
+                                    return _INTERRUPTED
                 
-                # Force sync to disk
-                fh.flush()
-                os.fsync(fh.fileno())
+                    # Every pass must reach the disk or writeback would coalesce them into the last one;
+                    # intermediate passes skip the metadata flush, the final pass gets a full fsync
+                    if mm is not None:
+                        mm.flush()
+                    fh.flush()
+                    if pass_num < total_passes and hasattr(os, "fdatasync"):
+                        os.fdatasync(fd)
+                    else:
+                        os.fsync(fd)
+                    # The synced pass is clean in the page cache and never read again - drop it
+                    # now so buffered passes stay bounded instead of filling the cache 35 times
+                    if io_engine and mm is None and direct_fd < 0:
+                        io_engine.release_cache(fd)
                 
-                LOG.debug(f"Pass {pass_num}/{total_passes} completed")
+                    if debug_enabled:
+                        LOG.debug("Pass %d/%d completed", pass_num, total_passes)
             
-            # Final verification
-            fh.seek(0)
-            final_data = fh.read(min(4096, original_size))
-            if final_data and not all(b == 0 for b in final_data[:100]):
-                LOG.warning("Final verification: non-zero data detected")
+            finally:
+                # Chunk views pin the mapping / staging buffer - drop them before closing
+                target = data = scratch_view = random_slots = None
+                if mm_view is not None:
+                    mm_view.release()
+                    del mm_anchor
+                if mm is not None:
+                    # Every pass is on disk - release the mapped pages without writeback
+                    if hasattr(mm, "madvise") and hasattr(mmap, "MADV_DONTNEED"):
+                        mm.madvise(mmap.MADV_DONTNEED)
+                    mm.close()
+                if stage is not None:
+                    stage_view.release()
+                    stage.close()
+                if direct_fd >= 0:
+                    os.close(direct_fd)
+                if io_engine:
+                    io_engine.release_cache(fh.fileno())
         
         return True, f"SECURE OVERWRITE COMPLETED - {total_passes} PASSES"
         
@@ -605,59 +1108,75 @@ def shred_file_Advanced_mode(
     keep_file: bool = False,
     progress: Optional[Callable[[int, int, str, int], None]] = None,
     stop_event: Optional[threading.Event] = None,
+    io_engine: Optional[AsyncWriteEngine] = None,
 ) -> Tuple[bool, str]:
     """Advanced MODE ULTIMATE file shredding"""
     
-    path = Path(path)
-    operation_id = secrets.token_hex(8)
+    path = os.fspath(path)
+    operation_id = os.urandom(8).hex()
     
-    LOG.info(f"[{operation_id}] STARTING Advanced MODE SHRED: {path}")
+    LOG.info("[%s] STARTING Advanced MODE SHRED: %s", operation_id, path)
     
     try:
-        # Validation
-        if not path.exists():
+        # Validation - lstat the unresolved path first so a symlink is rejected
+        # before anything follows it
+        try:
+            st = os.lstat(path)
+        except FileNotFoundError:
             raise ShredError("Target does not exist")
             
-        if not path.is_file():
-            raise ShredError("Target is not a regular file")
-            
         # Check for special files
-        if path.is_symlink():
+        if stat.S_ISLNK(st.st_mode):
             raise ShredError("Symbolic links not supported")
             
-        if path.is_dir():
+        if stat.S_ISDIR(st.st_mode):
             raise ShredError("Use shred_directory() for directories")
             
+        if not stat.S_ISREG(st.st_mode):
+            raise ShredError("Target is not a regular file")
+            
         # Check for system files
-        if _is_sensitive_system_path(path.absolute()):
+        if _is_sensitive_system_path(path):
             # Get detailed path info
-            abs_path = str(path.absolute()).lower()
+            abs_path = os.path.abspath(path).lower()
             user_home = str(Path.home()).lower()
             if abs_path.startswith(user_home):
                 # User directory - ask for confirmation
-                LOG.warning(f"Shredding in user directory: {path}")
+                LOG.warning("Shredding in user directory: %s", path)
             else:
                 raise ShredError(f"REFUSING TO SHRED SYSTEM PATH: {path}")
 
         # Get file info
-        original_size = path.stat().st_size
-        original_name = path.name
+        original_size = st.st_size
+        original_name = os.path.basename(path)
         
         if progress:
             progress(0, 1, " INITIATING Advanced MODE SHREDDING", original_size)
 
         # STEP 1: SECURE RENAME (ALWAYS)
-        LOG.info(f"Step 1: Secure rename - {original_name}")
+        LOG.info("Step 1: Secure rename - %s", original_name)
         scrambled_path = _secure_rename_ultimate(path)
         
         # STEP 2: ULTIMATE OVERWRITE
         LOG.info("Step 2: Secure overwrite - 35 passes")
-        overwrite_ok, overwrite_msg = _secure_overwrite_ultimate(
+        result = _secure_overwrite_ultimate(
             scrambled_path, 
             progress, 
-            stop_event
+            stop_event,
+            io_engine
         )
         
+        if result is _INTERRUPTED:
+            LOG.info("[%s] OPERATION INTERRUPTED: %s", operation_id, result[1])
+            # Cleanup on interruption
+            if not keep_file:
+                try:
+                    os.unlink(scrambled_path)
+                except OSError:
+                    pass
+            return result
+        
+        overwrite_ok, overwrite_msg = result
         if not overwrite_ok:
             raise ShredError(f"OVERWRITE FAILED: {overwrite_msg}")
 
@@ -668,10 +1187,10 @@ def shred_file_Advanced_mode(
         # STEP 4: FINAL DISPOSITION
         if not keep_file:
             LOG.info("Step 4: Final deletion")
-            scrambled_path.unlink()
+            os.unlink(scrambled_path)
             
             # Verify deletion
-            if scrambled_path.exists():
+            if os.path.lexists(scrambled_path):
                 raise ShredError("FILE STILL EXISTS AFTER DELETION")
             
             # Check for backup copies
@@ -682,69 +1201,102 @@ def shred_file_Advanced_mode(
             
             final_message = f"☠️ FILE DESTROYED: {original_name} -> IRRECOVERABLE"
         else:
-            final_message = f"✅ FILE PRESERVED: {original_name} -> {scrambled_path.name} (ALL METADATA OBFUSCATED)"
+            final_message = f"✅ FILE PRESERVED: {original_name} -> {os.path.basename(scrambled_path)} (ALL METADATA OBFUSCATED)"
 
-        LOG.info(f"[{operation_id}] Advanced MODE COMPLETED: {final_message}")
+        LOG.info("[%s] Advanced MODE COMPLETED: %s", operation_id, final_message)
         return True, final_message
         
-    except OperationInterrupted as exc:
-        LOG.info(f"[{operation_id}] OPERATION INTERRUPTED: {exc}")
-        # Cleanup on interruption
-        if not keep_file:
-            try:
-                if 'scrambled_path' in locals() and scrambled_path.exists():
-                    scrambled_path.unlink()
-            except:
-                pass
-        return False, str(exc)
-    except Exception as exc:
-        LOG.error(f"[{operation_id}] Advanced MODE FAILED: {exc}")
-        return False, f" Advanced MODE ERROR: {exc}"
+    except ShredError as exc:
+        LOG.error("[%s] Advanced MODE FAILED: %s", operation_id, exc)
+        return False, " Advanced MODE ERROR: %s" % exc
+    except OSError as exc:
+        LOG.error("[%s] Advanced MODE FAILED: IO %s: %s", operation_id, type(exc).__name__, exc.strerror or exc)
+        return False, " Advanced MODE ERROR: %s" % exc
+    except Exception as exc:  # Last resort - never let a shred escape as an exception
+        LOG.error("[%s] Advanced MODE FAILED: %s", operation_id, exc)
+        return False, " Advanced MODE ERROR: %s" % exc
+
+# Rough estimate: 50-100 MB/s per pass, 35 passes
+_SECONDS_PER_BYTE = 35 / (50 * 1024 * 1024)
+# (threshold seconds, scale, template) - largest unit first
+_ESTIMATE_UNITS = ((3600, 1 / 3600, "%.1f hours"), (60, 1 / 60, "%.1f minutes"), (float("-inf"), 1.0, "%.0f seconds"))
 
 def estimate_shred_time(file_size: int) -> str:
     """Estimate time for 35-pass shredding"""
-    # Rough estimate: 50-100 MB/s per pass
-    speed_per_pass = 50 * 1024 * 1024  # 50 MB/s
-    total_data = file_size * 35
-    seconds = total_data / speed_per_pass
-    
-    if seconds < 60:
-        return f"{seconds:.0f} seconds"
-    elif seconds < 3600:
-        return f"{seconds/60:.1f} minutes"
-    else:
-        return f"{seconds/3600:.1f} hours"
+    seconds = file_size * _SECONDS_PER_BYTE
+    for threshold, scale, template in _ESTIMATE_UNITS:
+        if seconds >= threshold:
+            return template % (seconds * scale)
 
-def verify_shred_completion(file_path: Path) -> bool:
+def verify_shred_completion(file_path: str | os.PathLike) -> bool:
     """Verify file was properly shredded"""
     try:
         # Check if file still exists
-        if file_path.exists():
+        if os.path.exists(file_path):
             return False
             
         # Check for backup copies
         for suffix in ['.bak', '.backup', '.old', '.temp', '.tmp']:
-            backup_file = file_path.with_suffix(file_path.suffix + suffix)
-            if backup_file.exists():
-                LOG.warning(f"Backup file found: {backup_file}")
+            backup_file = os.fspath(file_path) + suffix
+            if os.path.exists(backup_file):
+                LOG.warning("Backup file found: %s", backup_file)
                 return False
                 
         return True
     except:
         return False
 
+def _walk_files(directory: str | os.PathLike, dirs: Optional[List[str]] = None) -> Iterator[os.DirEntry]:
+    """Yield regular files below directory - DirEntry type info avoids per-file stat calls
+
+    Directories that were listed are appended to dirs in visit order (parents first)
+    """
+    # Explicit stack - deep trees cannot hit the recursion limit
+    pending = [directory]
+    while pending:
+        current = pending.pop()
+        try:
+            it = os.scandir(current)
+        except PermissionError as e:
+            if current is directory:
+                raise  # An unreadable root is reported by the caller
+            # One unreadable subtree must not abort the whole scan
+            LOG.warning("Skipping unreadable directory: %s", e)
+            continue
+        # Finish the listing before yielding - callers may rename files in this directory
+        with it:
+            listing = list(it)
+        if dirs is not None:
+            dirs.append(os.fspath(current))
+        for entry in listing:
+            if entry.is_dir(follow_symlinks=False):
+                # Prune sensitive subtrees here instead of walking them and filtering each file
+                if not _is_sensitive_system_path(entry.path):
+                    pending.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+def _entry_size(entry: os.DirEntry) -> int:
+    """Size of a discovered file, 0 if it vanished or cannot be stat'ed"""
+    try:
+        return entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        return 0
+
 def shred_directory(
     directory: str | os.PathLike,
     keep_file: bool = False,
     progress: Optional[Callable[[int, int, str, int], None]] = None,
     stop_event: Optional[threading.Event] = None,
+    io_engine: Optional[AsyncWriteEngine] = None,
+    shred_pool: Optional[ThreadPoolExecutor] = None,
 ) -> Tuple[bool, str]:
     """Directory shredding with maximum security"""
     
     directory = Path(directory)
-    operation_id = secrets.token_hex(8)
+    operation_id = os.urandom(8).hex()
     
-    LOG.info(f"[{operation_id}] STARTING DIRECTORY SHRED: {directory}")
+    LOG.info("[%s] STARTING DIRECTORY SHRED: %s", operation_id, directory)
 
     try:
         # Safety check for directory
@@ -761,114 +1313,176 @@ def shred_directory(
         if _is_sensitive_system_path(directory.absolute()):
             raise ShredError(f"REFUSING TO SHRED SYSTEM DIRECTORY: {directory}")
 
-        # Collect files
+        total_files = 0  # Grows while discovery runs; progress reads the current count
+        PROGRESS_INTERVAL = 0.1
+        last_report = 0.0
+        report_lock = threading.Lock()  # Pool workers share the throttle
+        # Set when any file reports cancellation so in-flight workers stop too
+        abort = threading.Event()
+
+        def shred_one(file_idx: int, file_path: str) -> Tuple[bool, str]:
+            nonlocal last_report
+            if abort.is_set() or (stop_event and stop_event.is_set()):
+                return _INTERRUPTED
+
+            def file_progress(cur_pass, total_passes, status, bytes_processed):
+                nonlocal last_report
+                if abort.is_set() or (stop_event and stop_event.is_set()):
+                    return False
+                if not progress:
+                    return True
+                
+                # ~10 UI updates per second across all files - formatting only happens past the throttle
+                now = time.monotonic()
+                with report_lock:
+                    if now - last_report < PROGRESS_INTERVAL:
+                        return True
+                    last_report = now
+                
+                file_progress_percent = (file_idx - 1 + cur_pass / total_passes) * 100.0 / total_files
+                return progress(file_idx, total_files, 
+                              f"FILE {file_idx}/{total_files}: {status} ({file_progress_percent:.1f}%)", 
+                              bytes_processed)
+
+            result = shred_file_Advanced_mode(
+                file_path,
+                keep_file=keep_file,
+                progress=file_progress,
+                stop_event=stop_event,
+                io_engine=io_engine,
+            )
+            # The throttle may have swallowed the file's last update - its completion always goes through
+            if progress and result is not _INTERRUPTED and result[0]:
+                with report_lock:
+                    last_report = time.monotonic()
+                progress(file_idx, total_files,
+                         f"FILE {file_idx}/{total_files}: COMPLETED ({file_idx * 100.0 / total_files:.1f}%)", 0)
+            return result
+
+        def stop_workers():
+            abort.set()
+            for future in futures:
+                future.cancel()
+            # Running shreds see abort and stop - wait so none outlives this call
+            wait(futures)
+
+        # Collect files - with a pool, each file is shredded as soon as it is found so
+        # enumeration overlaps the pass work. _walk_files lists a directory completely
+        # before yielding from it, so the renames never feed back into the walk.
         files = []
-        total_size = 0
+        entries = []
+        dirs: List[str] = []
+        futures: Dict[Future, str] = {}
         
         try:
-            for p in directory.rglob("*"):
+            for entry in _walk_files(directory, dirs):
                 if stop_event and stop_event.is_set():
-                    raise OperationInterrupted("Operation cancelled during file discovery")
-                    
-                if p.is_file() and not p.is_symlink():
-                    if not _is_sensitive_system_path(p.absolute()):
-                        files.append(p)
-                        try:
-                            total_size += p.stat().st_size
-                        except:
-                            pass
+                    stop_workers()
+                    LOG.info("[%s] INTERRUPTED: %s", operation_id, _DISCOVERY_INTERRUPTED[1])
+                    return _DISCOVERY_INTERRUPTED
+                
+                # The root was checked above and the walker prunes sensitive subdirectories; prefixes
+                # are whole leading components, so no file below a non-sensitive directory matches
+                files.append(entry.path)
+                total_files += 1
+                if shred_pool is not None:
+                    futures[shred_pool.submit(shred_one, total_files, entry.path)] = entry.path
+                else:
+                    entries.append(entry)
         except PermissionError as e:
+            stop_workers()
             error_msg = f"Permission denied. Try:\n1. Close any programs using these files\n2. Run as administrator\n3. Check permissions\nError: {e}"
             raise ShredError(error_msg)
+        except BaseException:
+            stop_workers()
+            raise
 
         if not files:
             return False, "No files found in directory"
 
-        # Estimate time for large directories
-        if total_size > 1024 * 1024 * 1024:  # >1GB
-            est_time = estimate_shred_time(total_size)
-            LOG.info(f"Estimated shred time for directory: {est_time}")
-
-        completed_files = 0
+        # Handle pool results in completion order so one large file never stalls the rest
+        if shred_pool is not None:
+            # Every file is already running and reporting against the growing count -
+            # a "starting" update or an up-front estimate would only rewind the bar
+            results = ((futures[future], future.result()) for future in as_completed(futures))
+        else:
+            # Sizes only feed the estimate
+            total_size = sum(map(_entry_size, entries))
 
-        if progress:
-            progress(0, len(files), f"FOUND {len(files)} FILES - STARTING SHRED", total_size)
+            # Estimate time for large directories
+            if total_size > 1024 * 1024 * 1024:  # >1GB
+                est_time = estimate_shred_time(total_size)
+                LOG.info("Estimated shred time for directory: %s", est_time)
 
-        for file_idx, file_path in enumerate(files, 1):
-            if stop_event and stop_event.is_set():
-                raise OperationInterrupted("Operation cancelled by user")
+            if progress:
+                progress(0, total_files, f"FOUND {total_files} FILES - STARTING SHRED", total_size)
 
-            def file_progress(cur_pass, total_passes, status, bytes_processed):
-                nonlocal completed_files
-                if stop_event and stop_event.is_set():
-                    return False
-                    
-                overall_progress = completed_files + (cur_pass / total_passes)
-                file_progress_percent = (file_idx - 1 + (cur_pass / total_passes)) / len(files) * 100
-                
-                if progress:
-                    return progress(file_idx, len(files), 
-                                  f"FILE {file_idx}/{len(files)}: {status} ({file_progress_percent:.1f}%)", 
-                                  bytes_processed)
-                return True
+            results = ((fp, shred_one(idx, fp)) for idx, fp in enumerate(files, 1))
 
-            ok, msg = shred_file_Advanced_mode(
-                file_path,
-                keep_file=keep_file,
-                progress=file_progress,
-                stop_event=stop_event,
-            )
-            
+        for file_path, result in results:
+            if result is _INTERRUPTED:
+                stop_workers()
+                LOG.info("[%s] INTERRUPTED: %s", operation_id, result[1])
+                return result
+            ok, msg = result
             if not ok:
-                if "cancelled" in msg.lower():
-                    raise OperationInterrupted(msg)
-                LOG.error(f"[{operation_id}] FAILED: {file_path}: {msg}")
-                
-            completed_files += 1
+                LOG.error("[%s] FAILED: %s: %s", operation_id, file_path, msg)
 
         # Remove directory if not keeping files
         if not (stop_event and stop_event.is_set()) and not keep_file:
-            try:
-                shutil.rmtree(directory)
-            except Exception as e:
-                LOG.warning(f"Could not remove directory: {e}")
+            # The walk already visited every directory - remove them deepest first without re-walking
+            for path in reversed(dirs):
+                try:
+                    os.rmdir(path)
+                except OSError:
+                    pass
+            # Anything still there (symlinks, special files, unreadable subtrees) goes the slow way
+            if os.path.lexists(directory):
+                try:
+                    shutil.rmtree(directory)
+                except Exception as e:
+                    LOG.warning("Could not remove directory: %s", e)
 
-        if keep_file:
-            success_msg = f"DIRECTORY OVERWRITTEN: {len(files)} FILES (PRESERVED)"
-        else:
-            success_msg = f"DIRECTORY DESTROYED: {len(files)} FILES - IRRECOVERABLE"
-            
-        LOG.info(f"[{operation_id}] {success_msg}")
-        return True, success_msg
+        template = _MSG_PRESERVED if keep_file else _MSG_DESTROYED
+        LOG.info("[%s] " + template, operation_id, total_files)
+        return True, template % total_files
         
-    except OperationInterrupted as exc:
-        LOG.info(f"[{operation_id}] INTERRUPTED: {exc}")
-        return False, str(exc)
-    except Exception as exc:
-        LOG.error(f"[{operation_id}] FAILED: {exc}")
-        return False, f"DIRECTORY ERROR: {exc}"
-
-def get_available_methods() -> Dict[str, Dict]:
-    """Get available shredding methods"""
-    return AdvancedModeShredder.METHOD_DETAILS.copy()
-
-def validate_shredding_path(path: str) -> Tuple[bool, str]:
+    except ShredError as exc:
+        LOG.error("[%s] FAILED: %s", operation_id, exc)
+        return False, "DIRECTORY ERROR: %s" % exc
+    except OSError as exc:
+        LOG.error("[%s] FAILED: IO %s: %s", operation_id, type(exc).__name__, exc.strerror or exc)
+        return False, "DIRECTORY ERROR: %s" % exc
+    except Exception as exc:  # Last resort - never let a shred escape as an exception
+        LOG.error("[%s] FAILED: %s", operation_id, exc)
+        return False, "DIRECTORY ERROR: %s" % exc
+
+def get_available_methods() -> Mapping[str, Mapping]:
+    """Get available shredding methods (read-only view, no per-call copy)"""
+    return _METHODS_VIEW
+
+def validate_shredding_path(path: str | os.PathLike) -> Tuple[bool, str]:
     """Validate if a path is safe for shredding"""
     try:
-        path_obj = Path(path)
-        
-        if not path_obj.exists():
-            return False, "Path does not exist"
+        # Plain strings throughout - no pathlib objects on the validator path
+        path = os.fspath(path)
+        # One lstat of the raw, unresolved path answers existence and symlink-ness
+        # before anything canonicalizes it
+        try:
+            st = os.lstat(path)
+        except FileNotFoundError:
+            return _INVALID_NOT_EXIST
             
-        if _is_sensitive_system_path(path_obj.absolute()):
-            return False, "Path is in system location"
+        if stat.S_ISLNK(st.st_mode):
+            return _INVALID_SYMLINK
             
-        if path_obj.is_symlink():
-            return False, "Symbolic links not supported"
+        if _is_sensitive_system_path(os.path.abspath(path)):
+            return _INVALID_SYSTEM
             
-        return True, "Path validated - Advanced MODE READY"
+        return _VALID_OK
     except Exception as e:
         return False, f"Validation error: {e}"
 
-# Alias for backward compatibility
+# Alias for backward compatibility - the same function object, so callers that import
+# shred_file bind it once and call it with no extra indirection
 shred_file = shred_file_Advanced_mode
\ No newline at end of file
@@ -5,12 +5,15 @@ Maximum security interface with file preservation options
 
 import sys
 import os
+import errno
+import shutil
 import platform
 import threading
+import time
+from collections import deque
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
-import secrets
 
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QLabel, QPushButton, QLineEdit, QCheckBox,
@@ -22,18 +25,88 @@ from PyQt6.QtGui import QTextCursor
 from secure_delete import shred_file, shred_directory, get_available_methods, validate_shredding_path
 from theme_manager import ThemeManager
 
+# copy_file_range refusals that mean "not between these files" rather than a real I/O error
+_NO_COPY_RANGE = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF}
+
+def _kernel_copy(src, dst, size: int):
+    """Copy size bytes between open files - copy_file_range, then sendfile, then a buffered loop"""
+    src_fd, dst_fd = src.fileno(), dst.fileno()
+    copy_range = getattr(os, "copy_file_range", None)
+    use_sendfile = hasattr(os, "sendfile")
+    offset = 0
+    while offset < size:
+        try:
+            if copy_range is not None:
+                sent = copy_range(src_fd, dst_fd, size - offset, offset, offset)
+            elif use_sendfile:
+                # sendfile writes at the destination file position
+                os.lseek(dst_fd, offset, os.SEEK_SET)
+                sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+            else:
+                src.seek(offset)
+                dst.seek(offset)
+                shutil.copyfileobj(src, dst)
+                return
+        except OSError as e:
+            if copy_range is not None and e.errno in _NO_COPY_RANGE:
+                copy_range = None
+            elif use_sendfile and e.errno in (errno.EINVAL, errno.ENOTSOCK, errno.ENOSYS):
+                use_sendfile = False  # File-to-file sendfile is Linux-only
+            else:
+                raise
+            continue
+        if not sent:
+            raise OSError(errno.EIO, "Source truncated during preserve copy")
+        offset += sent
+
+def _shredded_names(directory) -> set:
+    """Names of AdvancedMODE_* files in directory - one scandir pass, no per-entry stat"""
+    with os.scandir(directory) as it:
+        return {entry.name for entry in it if entry.name.startswith("AdvancedMODE_")}
+
+def _move_preserved(source: str, destination: str):
+    """Move a shredded file - O(1) rename on one filesystem, in-kernel copy across devices"""
+    try:
+        os.rename(source, destination)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    
+    created = False
+    try:
+        with open(source, "rb") as src, open(destination, "xb") as dst:
+            created = True
+            _kernel_copy(src, dst, os.fstat(src.fileno()).st_size)
+        shutil.copystat(source, destination)
+    except BaseException:
+        # Never leave a partial copy next to the intact source
+        if created:
+            try:
+                os.unlink(destination)
+            except OSError:
+                pass
+        raise
+    os.unlink(source)
+
 class ShreddingThread(QThread):
     """Thread for performing shredding operations"""
     
+    EMIT_INTERVAL = 0.033  # ~30 progress signals per second at most
+    
     progress_updated = pyqtSignal(int, int, str, int)
     operation_completed = pyqtSignal(bool, str)
     
-    def __init__(self, target_path: str, keep_file: bool, preserve_location: str = None):
+    def __init__(self, target_path: str, keep_file: bool, preserve_location: str = None,
+                 io_engine=None, shred_pool=None):
         super().__init__()
         self.target_path = target_path
         self.keep_file = keep_file
         self.preserve_location = preserve_location
+        self.io_engine = io_engine
+        self.shred_pool = shred_pool
         self.stop_event = threading.Event()
+        self._last_emit = 0.0
         
     def stop(self):
         """Request thread to stop"""
@@ -51,14 +124,17 @@ class ShreddingThread(QThread):
                         self.target_path,
                         keep_file=self.keep_file,
                         progress=self._progress_callback,
-                        stop_event=self.stop_event
+                        stop_event=self.stop_event,
+                        io_engine=self.io_engine
                     )
             else:
                 success, message = shred_directory(
                     self.target_path,
                     keep_file=self.keep_file,
                     progress=self._progress_callback,
-                    stop_event=self.stop_event
+                    stop_event=self.stop_event,
+                    io_engine=self.io_engine,
+                    shred_pool=self.shred_pool
                 )
             
             self.operation_completed.emit(success, message)
@@ -69,9 +145,6 @@ class ShreddingThread(QThread):
     def _shred_file_with_custom_location(self):
         """Shred file and move to custom location"""
         try:
-            import shutil
-            from pathlib import Path
-            
             source_file = Path(self.target_path)
             preserve_dir = Path(self.preserve_location)
             
@@ -79,25 +152,30 @@ class ShreddingThread(QThread):
             preserve_dir.mkdir(parents=True, exist_ok=True)
             
             # Generate secure random name for preserved file
-            random_name = "AdvancedMODE_PRESERVED_" + secrets.token_hex(16) + source_file.suffix
+            random_name = "AdvancedMODE_PRESERVED_" + os.urandom(16).hex() + source_file.suffix
             final_path = preserve_dir / random_name
             
+            # Snapshot existing shredded names so the new one is identified exactly -
+            # timestamps are obfuscated and listing order is arbitrary
+            source_dir = source_file.parent
+            existing = _shredded_names(source_dir)
+            
             # First shred the file in its original location
             success, message = shred_file(
                 self.target_path,
                 keep_file=True,  # Keep the file after shredding
                 progress=self._progress_callback,
-                stop_event=self.stop_event
+                stop_event=self.stop_event,
+                io_engine=self.io_engine
             )
             
             if success:
                 # Find the shredded file (it will have a random name in the same directory)
-                source_dir = source_file.parent
-                shredded_files = list(source_dir.glob("AdvancedMODE_*"))
+                shredded_files = _shredded_names(source_dir) - existing
                 
-                if shredded_files:
-                    # Move the last shredded file to the preserve location
-                    shutil.move(str(shredded_files[-1]), str(final_path))
+                if len(shredded_files) == 1:
+                    # Move the shredded file to the preserve location
+                    _move_preserved(str(source_dir / shredded_files.pop()), str(final_path))
                     return True, f"File shredded and moved to: {final_path}"
                 else:
                     return False, "Could not find shredded file for moving"
@@ -111,6 +189,11 @@ class ShreddingThread(QThread):
         """Progress callback for shredding operations"""
         if self.stop_event.is_set():
             return False
+        # Coalesce in the worker - every emit is a queued event plus four widget repaints
+        now = time.monotonic()
+        if now - self._last_emit < self.EMIT_INTERVAL and current < total:
+            return True
+        self._last_emit = now
         self.progress_updated.emit(current, total, status, bytes_processed)
         return True
 
@@ -130,8 +213,8 @@ class AdvancedModeShredderWindow(QMainWindow):
         # Load settings
         self.settings = QSettings("AdvancedModeShredder", "Config")
         
+        # init_ui ends in load_settings, which applies the saved theme once
         self.init_ui()
-        self.apply_theme(self.settings.value("theme", "cyber_dark"))
         
         # Fullscreen hint
         QTimer.singleShot(1000, self._show_fullscreen_hint)  # Show after 1 second delay
@@ -529,6 +612,15 @@ class AdvancedModeShredderWindow(QMainWindow):
             }
         """)
         layout.addWidget(self.log_text)
+        # Bounded document - old lines are dropped instead of relaid out forever
+        self.log_text.document().setMaximumBlockCount(5000)
+        
+        # Log lines are queued and appended in one batch per ~30Hz tick
+        self._log_queue = deque(maxlen=10000)
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(33)
+        self._log_timer.timeout.connect(self._flush_log)
         
         return panel
     
@@ -536,8 +628,11 @@ class AdvancedModeShredderWindow(QMainWindow):
         """Apply the selected theme"""
         self.theme_manager.apply_theme(theme_name, QApplication.instance())
         index = self.theme_combo.findText(theme_name)
-        if index >= 0:
+        if index >= 0 and index != self.theme_combo.currentIndex():
+            # Sync the combo silently - its change signal would apply the theme a second time
+            self.theme_combo.blockSignals(True)
             self.theme_combo.setCurrentIndex(index)
+            self.theme_combo.blockSignals(False)
         self.settings.setValue("theme", theme_name)
         
     def validate_path(self):
@@ -663,7 +758,9 @@ class AdvancedModeShredderWindow(QMainWindow):
         self.current_operation = ShreddingThread(
             path,
             self.keep_file_check.isChecked(),
-            preserve_location
+            preserve_location,
+            io_engine=getattr(QApplication.instance(), "io_engine", None),
+            shred_pool=getattr(QApplication.instance(), "shred_pool", None)
         )
         
         self.current_operation.progress_updated.connect(self.update_progress)
@@ -753,7 +850,17 @@ class AdvancedModeShredderWindow(QMainWindow):
     def log(self, message: str):
         """Add message to log with timestamp"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
+        self._log_queue.append(f"[{timestamp}] {message}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _flush_log(self):
+        """Append every queued log line with a single document update"""
+        if not self._log_queue:
+            return
+        lines = "\n".join(self._log_queue)
+        self._log_queue.clear()
+        self.log_text.append(lines)
         
         # Auto-scroll to bottom
         cursor = self.log_text.textCursor()
@@ -762,6 +869,7 @@ class AdvancedModeShredderWindow(QMainWindow):
     
     def clear_log(self):
         """Clear the log display"""
+        self._log_queue.clear()
         self.log_text.clear()
         self.log("🧹 LOG CLEARED - Advanced MODE SHREDDER ACTIVE")
     
@@ -774,6 +882,7 @@ class AdvancedModeShredderWindow(QMainWindow):
             "Text files (*.txt);;All files (*.*)"
         )
         if filename:
+            self._flush_log()
             try:
                 with open(filename, 'w', encoding='utf-8') as f:
                     f.write(self.log_text.toPlainText())
@@ -784,9 +893,11 @@ class AdvancedModeShredderWindow(QMainWindow):
     def load_settings(self):
         """Load saved settings"""
         saved_theme = self.settings.value("theme", "cyber_dark")
-        self.apply_theme(saved_theme)
+        keep_file = self.settings.value("keep_file", False, type=bool)
         
-        self.keep_file_check.setChecked(self.settings.value("keep_file", False, type=bool))
+        self.apply_theme(saved_theme)
+        self.keep_file_check.setChecked(keep_file)
+        self._saved_keep_file = keep_file
     
     def closeEvent(self, event):
         """Handle application close"""
@@ -806,6 +917,8 @@ class AdvancedModeShredderWindow(QMainWindow):
             else:
                 event.ignore()
         else:
-            # Save settings
-            self.settings.setValue("keep_file", self.keep_file_check.isChecked())
+            # Save settings - only a changed value reaches the registry/plist backend
+            keep_file = self.keep_file_check.isChecked()
+            if keep_file != self._saved_keep_file:
+                self.settings.setValue("keep_file", keep_file)
             event.accept()
\ No newline at end of file
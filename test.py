@@ -1,68 +1,65 @@
-import secrets
+import os
+import sys
 
-# === YOUR PATTERN LIST EXTRACTED VERBATIM ===
+# === PATTERN BUILDERS ===
+# Default arguments bind each seed at build time - no late-binding closures
+def _random():
+    return ("random", os.urandom)
+
+def _const(value):
+    return ("constant", lambda size, _p=bytes([value]): _p * size)
+
+def _repeat(seed):
+    return ("repeat", lambda size, _p=seed: (_p * (size // 3 + 1))[:size])
+
+
+# === GUTMANN PATTERN LIST ===
+# Each pass is tagged with its kind: "random", "constant" or "repeat" (3-byte cycle)
 PATTERNS = [
-    *[lambda size: secrets.token_bytes(size) for _ in range(4)],   # Random passes 1-4
-    lambda size: bytes([0x55] * size),                            # Pass 5
-    lambda size: bytes([0xAA] * size),                            # Pass 6
-    lambda size: bytes([0x92, 0x49, 0x24] * (size // 3 + 1))[:size], # Pass 7
-    lambda size: bytes([0x49, 0x24, 0x92] * (size // 3 + 1))[:size], # Pass 8
-    lambda size: bytes([0x24, 0x92, 0x49] * (size // 3 + 1))[:size], # Pass 9
-    lambda size: bytes([0x00] * size),                            # Pass 10
-    lambda size: bytes([0x11] * size),                            # Pass 11
-    lambda size: bytes([0x22] * size),                            # Pass 12
-    lambda size: bytes([0x33] * size),                            # Pass 13
-    lambda size: bytes([0x44] * size),                            # Pass 14
-    lambda size: bytes([0x55] * size),                            # Pass 15
-    lambda size: bytes([0x66] * size),                            # Pass 16
-    lambda size: bytes([0x77] * size),                            # Pass 17
-    lambda size: bytes([0x88] * size),                            # Pass 18
-    lambda size: bytes([0x99] * size),                            # Pass 19
-    lambda size: bytes([0xAA] * size),                            # Pass 20
-    lambda size: bytes([0xBB] * size),                            # Pass 21
-    lambda size: bytes([0xCC] * size),                            # Pass 22
-    lambda size: bytes([0xDD] * size),                            # Pass 23
-    lambda size: bytes([0xEE] * size),                            # Pass 24
-    lambda size: bytes([0xFF] * size),                            # Pass 25
-    lambda size: bytes([0x92, 0x49, 0x24] * (size // 3 + 1))[:size], # Pass 26
-    lambda size: bytes([0x49, 0x24, 0x92] * (size // 3 + 1))[:size], # Pass 27
-    lambda size: bytes([0x24, 0x92, 0x49] * (size // 3 + 1))[:size], # Pass 28
-    lambda size: bytes([0x6D, 0xB6, 0xDB] * (size // 3 + 1))[:size], # Pass 29
-    lambda size: bytes([0xB6, 0xDB, 0x6D] * (size // 3 + 1))[:size], # Pass 30
-    lambda size: bytes([0xDB, 0x6D, 0xB6] * (size // 3 + 1))[:size], # Pass 31
-    *[lambda size: secrets.token_bytes(size) for _ in range(4)]    # Random passes 32-35
+    *[_random() for _ in range(4)],                                         # Random passes 1-4
+    _const(0x55), _const(0xAA),                                             # Passes 5-6
+    *map(_repeat, (b"\x92\x49\x24", b"\x49\x24\x92", b"\x24\x92\x49")),     # Passes 7-9
+    *[_const(value) for value in range(0x00, 0x100, 0x11)],                 # Passes 10-25 (0x00..0xFF)
+    *map(_repeat, (b"\x92\x49\x24", b"\x49\x24\x92", b"\x24\x92\x49",       # Passes 26-31
+                   b"\x6D\xB6\xDB", b"\xB6\xDB\x6D", b"\xDB\x6D\xB6")),
+    *[_random() for _ in range(4)],                                         # Random passes 32-35
 ]
 
+# Only this many bytes of each pass are ever shown
+PREVIEW_BYTES = 64
+
+PASS_TYPE_LABELS = {
+    "random": "RANDOM (cryptographically secure)",
+    "constant": "CONSTANT PATTERN",
+    "repeat": "REPEATING MULTI-BYTE PATTERN",
+}
+
 
 # === VISUALIZER ===
 def inspect_gutmann(size=64):
-    print(f"\n=== GUTMANN 35-PASS VISUALIZER (size={size} bytes) ===\n")
-    for i, pattern_fn in enumerate(PATTERNS, start=1):
-        data = pattern_fn(size)
-
-        print(f"\n--- PASS {i} ---")
-
-        # Detect pattern type
-        is_random = False
-        if i <= 4 or i >= 32:
-            is_random = True
-        
-        if is_random:
-            print("TYPE: RANDOM (cryptographically secure)")
-        else:
-            print("TYPE:", "CONSTANT PATTERN" if len(set(data)) == 1 else "REPEATING MULTI-BYTE PATTERN")
+    # Lines are collected and written once - one stdout write instead of ~180 prints
+    lines = [f"\n=== GUTMANN 35-PASS VISUALIZER (size={size} bytes) ===\n"]
+    for i, (kind, pattern_fn) in enumerate(PATTERNS, start=1):
+        # Patterns are prefix-stable, so the preview alone is generated - never the full pass
+        data = pattern_fn(min(size, PREVIEW_BYTES))
+
+        lines.append(f"\n--- PASS {i} ---")
+
+        # Pattern type comes from the tag - no scan of the data
+        lines.append(f"TYPE: {PASS_TYPE_LABELS[kind]}")
 
         # Print byte statistics
-        print(f"Length: {len(data)} bytes")
+        lines.append(f"Length: {size} bytes")
 
         # Show first 64 bytes in hex
-        print("Hex preview:", data[:64].hex(" ").upper())
+        lines.append(f"Hex preview: {data.hex(' ').upper()}")
 
         # If constant, also print repeated value
-        if len(set(data)) == 1:
-            print(f"Constant byte: {hex(data[0])}")
+        if kind == "constant" and data:
+            lines.append(f"Constant byte: {hex(data[0])}")
 
-    print("\n=== END ===\n")
+    lines.append("\n=== END ===\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # RUN DEMO
@@ -0,0 +1,214 @@
+import errno
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import secure_delete
+
+
+class SequentialBackendTest(unittest.TestCase):
+    """Engines without pwritev share one file position - they must never write ranges concurrently"""
+
+    SIZE = 6 * 1024 * 1024 + 123
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.engine = secure_delete.AsyncWriteEngine(max_workers=4, use_mmap=False)
+        self.engine.backend = "sequential"
+
+    def tearDown(self):
+        self.engine.shutdown()
+        shutil.rmtree(self.root)
+
+    def _shred_kept(self, patterns):
+        path = os.path.join(self.root, "target.bin")
+        with open(path, "wb") as fh:
+            fh.write(b"A" * self.SIZE)
+        with mock.patch.object(secure_delete, "_is_rotational_device", return_value=False), \
+                mock.patch.dict(secure_delete.AdvancedModeShredder.PATTERNS, {"gutmann_35_pass": patterns}):
+            ok, msg = secure_delete.shred_file(path, keep_file=True, io_engine=self.engine)
+        self.assertTrue(ok, msg)
+        (name,) = os.listdir(self.root)
+        with open(os.path.join(self.root, name), "rb") as fh:
+            return fh.read()
+
+    def test_deterministic_pass_covers_whole_file(self):
+        data = self._shred_kept([secure_delete._ConstPattern(b"\x55")])
+        self.assertEqual(len(data), self.SIZE)
+        self.assertEqual(data, b"\x55" * self.SIZE)
+
+    def test_random_passes_cover_whole_file(self):
+        data = self._shred_kept([secure_delete._RandomPattern() for _ in range(2)])
+        self.assertEqual(len(data), self.SIZE)
+        # Any surviving 4KB run of the original bytes means a range was skipped
+        self.assertNotIn(b"A" * 4096, data)
+
+    def test_random_passes_cover_whole_file_with_pwritev(self):
+        if not hasattr(os, "pwritev"):
+            self.skipTest("pwritev unavailable")
+        self.engine.backend = "pwritev"
+        data = self._shred_kept([secure_delete._RandomPattern() for _ in range(2)])
+        self.assertEqual(len(data), self.SIZE)
+        self.assertNotIn(b"A" * 4096, data)
+
+
+class MmapFallbackTest(unittest.TestCase):
+    SIZE = 300_000
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.engine = secure_delete.AsyncWriteEngine(max_workers=2, use_mmap=True)
+
+    def tearDown(self):
+        self.engine.shutdown()
+        shutil.rmtree(self.root)
+
+    def _shred_kept(self):
+        path = os.path.join(self.root, "target.bin")
+        with open(path, "wb") as fh:
+            fh.write(b"A" * self.SIZE)
+        ok, msg = secure_delete.shred_file(path, keep_file=True, io_engine=self.engine)
+        self.assertTrue(ok, msg)
+        (name,) = os.listdir(self.root)
+        with open(os.path.join(self.root, name), "rb") as fh:
+            return fh.read()
+
+    def test_unmappable_file_falls_back_to_writes(self):
+        real_mmap = secure_delete.mmap.mmap
+
+        def no_shared_mapping(fileno, *args, **kwargs):
+            if fileno != -1:
+                raise OSError(errno.ENODEV, "No such device")
+            return real_mmap(fileno, *args, **kwargs)
+
+        with mock.patch.object(secure_delete.mmap, "mmap", side_effect=no_shared_mapping):
+            data = self._shred_kept()
+        self.assertEqual(len(data), self.SIZE)
+        self.assertNotIn(b"A" * 4096, data)
+
+    def test_low_free_space_skips_the_mapping(self):
+        with mock.patch.object(secure_delete, "_mmap_headroom_ok", return_value=False), \
+                mock.patch.object(secure_delete.mmap, "mmap", wraps=secure_delete.mmap.mmap) as mapper:
+            data = self._shred_kept()
+        self.assertFalse([c for c in mapper.call_args_list if c.args and c.args[0] != -1])
+        self.assertEqual(len(data), self.SIZE)
+        self.assertNotIn(b"A" * 4096, data)
+
+
+class DirectDescriptorTest(unittest.TestCase):
+    def test_failed_open_leaks_no_direct_descriptor(self):
+        root = tempfile.mkdtemp()
+        engine = secure_delete.AsyncWriteEngine(use_mmap=False)
+        opened = []
+
+        def open_direct(path):
+            opened.append(os.open(path, os.O_RDWR))
+            return opened[-1]
+
+        try:
+            path = os.path.join(root, "target.bin")
+            with open(path, "wb") as fh:
+                fh.write(b"A" * 100_000)
+            with mock.patch.object(engine, "open_direct", side_effect=open_direct), \
+                    mock.patch("builtins.open", side_effect=PermissionError(errno.EACCES, "denied")):
+                with self.assertRaises(secure_delete.ShredError):
+                    secure_delete._secure_overwrite_ultimate(path, io_engine=engine)
+            for fd in opened:
+                with self.assertRaises(OSError):
+                    os.fstat(fd)
+        finally:
+            engine.shutdown()
+            shutil.rmtree(root)
+
+
+class ShredDirectoryProgressTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.target = os.path.join(self.root, "tree")
+        os.makedirs(os.path.join(self.target, "sub"))
+        for i in range(6):
+            with open(os.path.join(self.target, "sub" if i % 2 else "", f"f{i}.bin"), "wb") as fh:
+                fh.write(b"A" * 4096)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_pooled_shred_never_rewinds_the_bar(self):
+        calls = []
+
+        def progress(current, total, status, bytes_processed):
+            calls.append((current, status))
+            return True
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            ok, msg = secure_delete.shred_directory(self.target, progress=progress, shred_pool=pool)
+        self.assertTrue(ok, msg)
+        self.assertFalse([status for current, status in calls if "STARTING SHRED" in status])
+
+    def test_throttle_holds_through_the_final_pass(self):
+        calls = []
+
+        def progress(current, total, status, bytes_processed):
+            calls.append(status)
+            return True
+
+        # A frozen clock keeps every update after the first inside the throttle window
+        with mock.patch.object(secure_delete.time, "monotonic", return_value=1000.0):
+            ok, msg = secure_delete.shred_directory(self.target, progress=progress)
+        self.assertTrue(ok, msg)
+        per_file = [status for status in calls if status.startswith("FILE ")]
+        self.assertEqual(sum("COMPLETED" in status for status in per_file), 6)
+        self.assertEqual(len(per_file), 7)
+
+
+class RotationalDetectionTest(unittest.TestCase):
+    def test_unknown_device_is_treated_as_rotational(self):
+        if not hasattr(os, "makedev"):
+            self.skipTest("device numbers unavailable")
+        # No sysfs node exists for this device number
+        self.assertTrue(secure_delete._is_rotational_device.__wrapped__(os.makedev(4095, 1048575)))
+
+
+class PreloadPassBuffersTest(unittest.TestCase):
+    def test_region_is_the_only_copy(self):
+        patterns = [p for p in secure_delete.AdvancedModeShredder.get_wipe_method()
+                    if isinstance(p, secure_delete._ConstPattern)]
+        saved = [p.buf for p in patterns]
+        engine = secure_delete.AsyncWriteEngine(use_mmap=False)
+        try:
+            for pattern in patterns:
+                pattern.buf = b""
+            buffers = engine.preload_pass_buffers(64 * 1024)
+            self.assertEqual([p.buf for p in patterns], [b""] * len(patterns))
+        finally:
+            for pattern, buf in zip(patterns, saved):
+                pattern.buf = buf
+            engine.shutdown()
+        wipe = secure_delete.AdvancedModeShredder.get_wipe_method()
+        for pass_num, buf in buffers.items():
+            self.assertEqual(bytes(buf), bytes(wipe[pass_num - 1]._build(64 * 1024)))
+
+
+@unittest.skipIf(secure_delete._IS_WINDOWS, "Unix path rules")
+class SensitivePathTest(unittest.TestCase):
+    def setUp(self):
+        secure_delete._is_sensitive_abs_path.cache_clear()
+
+    def test_user_volumes_and_temp_dirs_are_allowed(self):
+        for path in ("/media/user/USB/report.pdf", "/mnt/data/archive.zip",
+                     "/var/folders/xy/abc123/T/scratch.tmp", "/var/tmp/upload.bin"):
+            with self.subTest(path=path):
+                self.assertFalse(secure_delete._is_sensitive_system_path(path))
+
+    def test_system_trees_are_refused(self):
+        for path in ("/etc/passwd", "/var/lib/dpkg/status", "/var/log/syslog", "/usr/bin/python3",
+                     "/var/db/receipts/x.bom", "/var", "/media/", "/mnt", "/"):
+            with self.subTest(path=path):
+                self.assertTrue(secure_delete._is_sensitive_system_path(path))
+
+
+if __name__ == "__main__":
+    unittest.main()